@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmarks of SkewStudent hot paths.
+
+Run with ``asv run`` from the root of the repository. Results are stored
+per commit in ``.asv/results``, compare two commits with
+``asv compare <commit1> <commit2>`` or ``asv continuous``.
+
+"""
+from __future__ import print_function, division
+
+import numpy as np
+
+from skewstudent import SkewStudent
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+SIZES = [10, 10**4, 10**6, 10**8]
+REGIMES = {'heavy': (2.1, 0.), 'normal': (100., 0.),
+           'left': (5., -.95), 'right': (5., .95)}
+DTYPES = ['float64', 'float32']
+
+
+class Density(object):
+
+    """PDF, log-PDF and CDF."""
+
+    params = [SIZES, list(REGIMES), DTYPES]
+    param_names = ['size', 'regime', 'dtype']
+    timeout = 1200
+
+    def setup(self, size, regime, dtype):
+        self.skewt = SkewStudent(*REGIMES[regime])
+        rng = np.random.default_rng(0)
+        self.arg = rng.standard_normal(size).astype(dtype)
+        self.out = np.empty_like(self.arg)
+
+    def time_pdf(self, size, regime, dtype):
+        self.skewt.pdf(self.arg, out=self.out)
+
+    def time_logpdf(self, size, regime, dtype):
+        self.skewt.logpdf(self.arg, out=self.out)
+
+    def time_cdf(self, size, regime, dtype):
+        self.skewt.cdf(self.arg, out=self.out)
+
+    def peakmem_pdf(self, size, regime, dtype):
+        self.skewt.pdf(self.arg, out=self.out)
+
+
+class Quantile(object):
+
+    """Exact and tabulated ICDF."""
+
+    params = [SIZES, list(REGIMES)]
+    param_names = ['size', 'regime']
+    timeout = 1200
+
+    def setup(self, size, regime):
+        self.skewt = SkewStudent(*REGIMES[regime])
+        self.arg = np.random.default_rng(0).uniform(size=size)
+        self.out = np.empty_like(self.arg)
+        self.skewt.ppf(.5, approx=True)
+
+    def time_ppf(self, size, regime):
+        self.skewt.ppf(self.arg, out=self.out)
+
+    def time_ppf_approx(self, size, regime):
+        self.skewt.ppf(self.arg, out=self.out, approx=True)
+
+    def time_expected_shortfall(self, size, regime):
+        self.skewt.expected_shortfall(self.arg)
+
+
+class Scalar(object):
+
+    """Single-point evaluation."""
+
+    params = [list(REGIMES)]
+    param_names = ['regime']
+
+    def setup(self, regime):
+        self.skewt = SkewStudent(*REGIMES[regime])
+
+    def time_pdf(self, regime):
+        self.skewt.pdf(.3)
+
+    def time_cdf(self, regime):
+        self.skewt.cdf(.3)
+
+    def time_ppf(self, regime):
+        self.skewt.ppf(.3)
+
+
+class Sampling(object):
+
+    """Random variates."""
+
+    params = [SIZES, list(REGIMES)]
+    param_names = ['size', 'regime']
+    timeout = 1200
+
+    def setup(self, size, regime):
+        self.skewt = SkewStudent(*REGIMES[regime])
+        self.rng = np.random.default_rng(0)
+
+    def time_rvs(self, size, regime):
+        self.skewt.rvs(size=size, random_state=self.rng)
+
+
+class Likelihood(object):
+
+    """Log-likelihood and its derivatives."""
+
+    params = [SIZES[:-1], list(REGIMES)]
+    param_names = ['size', 'regime']
+    timeout = 1200
+
+    def setup(self, size, regime):
+        self.param = REGIMES[regime]
+        self.skewt = SkewStudent(*self.param)
+        self.data = self.skewt.rvs(size=size, random_state=0)
+
+    def time_loglikelihood(self, size, regime):
+        self.skewt.loglikelihood(self.param, self.data)
+
+    def time_loglikelihood_and_grad(self, size, regime):
+        self.skewt.loglikelihood_and_grad(self.param, self.data)
+
+    def time_loglikelihood_hess(self, size, regime):
+        self.skewt.loglikelihood_hess(self.param, self.data)
+
+
+class LikelihoodGrid(object):
+
+    """Log-likelihood surface over a grid of parameters."""
+
+    params = [[2520, 10**5], [20, 200]]
+    param_names = ['size', 'grid']
+    timeout = 1200
+
+    def setup(self, size, grid):
+        self.skewt = SkewStudent(*REGIMES['left'])
+        self.data = self.skewt.rvs(size=size, random_state=0)
+        self.eta = np.linspace(2.5, 30, grid)
+        self.lam = np.linspace(-.9, .9, grid)
+
+    def time_loglikelihood_grid(self, size, grid):
+        self.skewt.loglikelihood_grid(self.eta, self.lam, self.data)
+
+
+class Fit(object):
+
+    """Maximum likelihood estimation."""
+
+    params = [[500, 5000, 10**5], [1, 20]]
+    param_names = ['nobs', 'nseries']
+    timeout = 1200
+
+    def setup(self, nobs, nseries):
+        skewt = SkewStudent(eta=5., lam=-.3)
+        self.data = skewt.rvs(size=(nobs, nseries), random_state=0)
+
+    def time_fit(self, nobs, nseries):
+        SkewStudent.fit(self.data)
+
+    def time_fit_warm(self, nobs, nseries):
+        SkewStudent.fit(self.data, param_start=(5., -.3))
+
+
+class Backend(object):
+
+    """PDF, log-PDF and log-likelihood with NumPy and compiled kernels."""
+
+    params = [SIZES[1:], ['numpy', 'numba']]
+    param_names = ['size', 'backend']
+    timeout = 1200
+
+    def setup(self, size, backend):
+        self.param = (5., -.3)
+        self.skewt = SkewStudent(*self.param, backend=backend)
+        if self.skewt.backend != backend:
+            raise NotImplementedError
+        self.arg = np.random.default_rng(0).standard_normal(size)
+        self.out = np.empty_like(self.arg)
+        self.skewt.pdf(self.arg[:10])
+        self.skewt.logpdf(self.arg[:10])
+        self.skewt.loglikelihood(self.param, self.arg[:10])
+
+    def time_pdf(self, size, backend):
+        self.skewt.pdf(self.arg, out=self.out)
+
+    def time_logpdf(self, size, backend):
+        self.skewt.logpdf(self.arg, out=self.out)
+
+    def time_loglikelihood(self, size, backend):
+        self.skewt.loglikelihood(self.param, self.arg)
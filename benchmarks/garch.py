@@ -0,0 +1,30 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Benchmarks of SkewStudentGARCH.
+
+"""
+from __future__ import print_function, division
+
+from skewstudent import SkewStudentGARCH
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class GARCH(object):
+
+    """Likelihood and estimation of GARCH model."""
+
+    params = [[2520, 25200]]
+    param_names = ['nobs']
+
+    def setup(self, nobs):
+        self.model = SkewStudentGARCH(omega=.05, alpha=.05, beta=.9,
+                                      eta=5., lam=-.3)
+        self.data = self.model.simulate(nobs, random_state=0)[0]
+
+    def time_loglikelihood_and_grad(self, nobs):
+        self.model.loglikelihood_and_grad(self.model.param, self.data)
+
+    def time_fit(self, nobs):
+        SkewStudentGARCH.fit(self.data)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Import time benchmarks.
+
+Run with ``asv run`` from the root of the repository.
+
+"""
+from __future__ import print_function, division
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class ImportSuite(object):
+
+    """Time to import the package in a fresh interpreter."""
+
+    def timeraw_import_skewstudent(self):
+        """Import core package."""
+        return "import skewstudent"
+
+    def timeraw_import_plotting(self):
+        """Import optional plotting module."""
+        return "import skewstudent.plotting"
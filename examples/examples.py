@@ -8,7 +8,6 @@ from __future__ import print_function, division
 import numpy as np
 import matplotlib.pylab as plt
 import seaborn as sns
-from scipy.optimize import minimize
 
 from skewstudent import SkewStudent
 
@@ -26,7 +25,6 @@ if __name__ == '__main__':
     sns.kdeplot(data)
     plt.show()
 
-    bounds = [(2.01, 300), (-1, 1)]
-    res = minimize(skewt.loglikelihood, [10, 0], args=(data,), method='SLSQP',
-                   bounds=bounds)
-    print(res)
\ No newline at end of file
+    res = SkewStudent.fit(data)
+    print(res)
+    print('Standard errors:', np.diag(res.cov)**.5)
@@ -17,7 +17,10 @@ setup(name='skewstudent',
       author_email='khrapovs@gmail.com',
       url='https://github.com/khrapovs/skewstudent',
       py_modules=['skewstudent'],
-      packages=find_packages(),
+      packages=find_packages(exclude=['benchmarks']),
+      python_requires='>=3.8',
+      install_requires=['numpy>=1.17', 'scipy>=1.7'],
+      extras_require={'plot': ['matplotlib', 'seaborn'], 'jit': ['numba']},
       keywords=['skew', 'student', 'distribution', 'pdf', 'cdf', 'simulation'],
       classifiers=[
         'Development Status :: 4 - Beta',
@@ -25,8 +28,12 @@ setup(name='skewstudent',
         'Intended Audience :: Financial and Insurance Industry',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 2.7',
-        'Programming Language :: Python :: 3.3',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
       ],
 )
@@ -1 +1,24 @@
+from importlib import import_module
+
 from .skewstudent import *
+
+# models pull in scipy.signal and scipy.stats, import them on first use
+_LAZY = {'SkewStudentGARCH': 'garch',
+         'SkewStudentARCD': 'arcd',
+         'skewt_gen': 'distributions',
+         'skewt': 'distributions',
+         'ScenarioGenerator': 'scenarios',
+         'PITBacktest': 'backtest'}
+
+__all__ = skewstudent.__all__ + list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(import_module('.' + _LAZY[name], __name__), name)
+    raise AttributeError('module {!r} has no attribute {!r}'
+                         .format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+r"""
+Autoregressive conditional density
+==================================
+
+Skewed Student distribution with time-varying parameters as in [1]_.
+Degrees of freedom and skewness of standardized residuals :math:`z_{t}`
+follow logistic transformations
+
+.. math::
+
+    \eta_{t}=\underline{\eta}+\left(\overline{\eta}-\underline{\eta}\right)
+        \Lambda\left(\tilde{\eta}_{t}\right),\quad
+    \lambda_{t}=\underline{\lambda}
+        +\left(\overline{\lambda}-\underline{\lambda}\right)
+        \Lambda\left(\tilde{\lambda}_{t}\right),
+
+where :math:`\Lambda` is the logistic function, of the recursions
+
+.. math::
+
+    \tilde{\eta}_{t}=\omega_{\eta}+\alpha_{\eta}z_{t-1}
+        +\beta_{\eta}\left|z_{t-1}\right|+\gamma_{\eta}\tilde{\eta}_{t-1},\quad
+    \tilde{\lambda}_{t}=\omega_{\lambda}+\alpha_{\lambda}z_{t-1}
+        +\beta_{\lambda}\left|z_{t-1}\right|
+        +\gamma_{\lambda}\tilde{\lambda}_{t-1}.
+
+Recursions start from :math:`\omega/(1-\gamma)`. They are driven by
+observed residuals only, so both are evaluated with `scipy.signal.lfilter`
+for all periods and all series at once. The a, b, and c constants of
+`SkewStudent` are then computed vectorized over time.
+
+Data is an array of standardized residuals with time along the last axis
+and independent series along leading axes. Parameters are ordered as
+
+.. math::
+
+    \left(\omega_{\eta},\alpha_{\eta},\beta_{\eta},\gamma_{\eta},
+    \omega_{\lambda},\alpha_{\lambda},\beta_{\lambda},\gamma_{\lambda}\right)
+
+and either shared by all series or given one row per series.
+
+References
+----------
+
+.. [1] Hansen, B. E. (1994). Autoregressive conditional density estimation.
+    *International Economic Review*, 35(3), 705–730.
+
+Examples
+--------
+>>> param = [0, 0, 0, 0, -.5, .3, 0, .5]
+>>> data = SkewStudentARCD.simulate(param, 1000, nseries=3, random_state=0)
+>>> eta, lam = SkewStudentARCD.dynamics(param, data)
+>>> print(SkewStudentARCD.loglikelihood(param, data))
+[1353.71508462 1390.57468085 1369.8625951 ]
+
+"""
+
+from __future__ import print_function, division
+
+import numpy as np
+
+from scipy.optimize import minimize
+from scipy.signal import lfilter
+from scipy.special import expit
+
+from .skewstudent import SkewStudent, _check_random_state, _stack_results
+
+__all__ = ['SkewStudentARCD']
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class SkewStudentARCD(object):
+
+    """Skewed Student distribution with autoregressive parameters.
+
+    Attributes
+    ----------
+    eta_bounds : tuple
+        Range of degrees of freedom
+    lam_bounds : tuple
+        Range of skewness
+
+    Methods
+    -------
+    dynamics
+        Time-varying degrees of freedom and skewness
+    loglikelihood
+        Negative log-likelihood of each series
+    fit
+        Maximum likelihood estimation
+    simulate
+        Simulate standardized residuals
+
+    """
+
+    eta_bounds = (2.1, 30.)
+    lam_bounds = (-.9, .9)
+
+    @classmethod
+    def dynamics(cls, param, data):
+        """Time-varying degrees of freedom and skewness.
+
+        Parameters
+        ----------
+        param : array
+            Parameters, either (8, ) or one row per series
+        data : array
+            Standardized residuals, time along the last axis
+
+        Returns
+        -------
+        eta : array
+            Degrees of freedom. Same shape as the input.
+        lam : array
+            Skewness. Same shape as the input.
+
+        """
+        data = np.asarray(data, dtype=float)
+        param = np.asarray(param, dtype=float)
+        eta = _recursion(param[..., :4], data)
+        lam = _recursion(param[..., 4:], data)
+
+        eta_min, eta_max = cls.eta_bounds
+        lam_min, lam_max = cls.lam_bounds
+        eta = eta_min + (eta_max-eta_min) * expit(eta)
+        lam = lam_min + (lam_max-lam_min) * expit(lam)
+        return eta, lam
+
+    @classmethod
+    def loglikelihood(cls, param, data):
+        """Negative log-likelihood of each series.
+
+        Parameters
+        ----------
+        param : array
+            Parameters, either (8, ) or one row per series
+        data : array
+            Standardized residuals, time along the last axis
+
+        Returns
+        -------
+        float or array
+            Negative log-likelihood. Same shape as the input without
+            the last axis.
+
+        """
+        eta, lam = cls.dynamics(param, data)
+
+        return -SkewStudent(eta=eta, lam=lam).logpdf(data).sum(-1)
+
+    @classmethod
+    def fit(cls, data, param_start=None, bounds=None, method='L-BFGS-B',
+            options=None):
+        """Fit parameters by maximum likelihood.
+
+        Parameters
+        ----------
+        data : array
+            Standardized residuals. A 2-D array is treated as a collection
+            of independent series, one per row.
+        param_start : array, optional
+            Starting values, either (8, ) or one row per series. Defaults
+            to constant parameters in the middle of their ranges.
+        bounds : sequence, optional
+            Bounds on parameters passed to `scipy.optimize.minimize`.
+            By default autoregressive coefficients are bounded by .99 in
+            absolute value.
+        method : str
+            Optimization method passed to `scipy.optimize.minimize`
+        options : dict, optional
+            Options passed to `scipy.optimize.minimize`
+
+        Returns
+        -------
+        OptimizeResult
+            Optimization result. For 2-D data, `x`, `fun`, `success`,
+            `status` and `nit` are stacked along the first axis, one row per
+            series. Covariance is not computed, so `cov` is NaN.
+
+        """
+        data = np.asarray(data, dtype=float)
+        if param_start is None:
+            param_start = np.zeros(8)
+        if bounds is None:
+            bounds = 2 * ([(None, None)] * 3 + [(-.99, .99)])
+        param_start = np.asarray(param_start, dtype=float)
+
+        if data.ndim == 1:
+            return _fit_series(cls, data, param_start, bounds, method,
+                               options)
+
+        param_start = np.broadcast_to(param_start, (data.shape[0], 8))
+        return _stack_results([_fit_series(cls, series, start, bounds,
+                                           method, options)
+                               for series, start in zip(data, param_start)])
+
+    @classmethod
+    def simulate(cls, param, nobs, nseries=None, random_state=None):
+        """Simulate standardized residuals.
+
+        Parameters
+        ----------
+        param : array
+            Parameters, either (8, ) or one row per series
+        nobs : int
+            Number of observations
+        nseries : int, optional
+            Number of series. Returns 1-D array if None.
+        random_state : None, int, Generator or RandomState
+            Source of randomness, see `SkewStudent.rvs`
+
+        Returns
+        -------
+        array
+            Standardized residuals, time along the last axis
+
+        """
+        rng = _check_random_state(random_state)
+        param = np.asarray(param, dtype=float)
+        size = (1 if nseries is None else nseries, )
+        eta_min, eta_max = cls.eta_bounds
+        lam_min, lam_max = cls.lam_bounds
+
+        data = np.empty(size + (nobs, ))
+        state = param[..., [0, 4]] / (1 - param[..., [3, 7]])
+        state = np.broadcast_to(state, size + (2, )).copy()
+        for t in range(nobs):
+            if t > 0:
+                lag = data[:, t-1, np.newaxis]
+                state = param[..., [0, 4]] + param[..., [1, 5]] * lag \
+                    + param[..., [2, 6]] * np.abs(lag) \
+                    + param[..., [3, 7]] * state
+            eta = eta_min + (eta_max-eta_min) * expit(state[:, 0])
+            lam = lam_min + (lam_max-lam_min) * expit(state[:, 1])
+            data[:, t] = SkewStudent(eta=eta, lam=lam).rvs(random_state=rng)
+
+        if nseries is None:
+            return data[0]
+        return data
+
+
+def _recursion(param, data):
+    """Autoregression driven by lagged residuals.
+
+    Parameters
+    ----------
+    param : array
+        Coefficients (omega, alpha, beta, gamma), either (4, ) or one row
+        per series
+    data : array
+        Standardized residuals, time along the last axis
+
+    Returns
+    -------
+    array
+        Recursion values. Same shape as the input.
+
+    """
+    omega, alpha, beta, gamma = [coef[..., np.newaxis]
+                                 for coef in np.moveaxis(param, -1, 0)]
+    innov = np.empty(np.broadcast(data, omega).shape)
+    innov[..., :1] = omega / (1-gamma)
+    innov[..., 1:] = omega + alpha * data[..., :-1] \
+        + beta * np.abs(data[..., :-1])
+
+    if param.ndim == 1:
+        return lfilter([1.], [1., -param[3]], innov, axis=-1)
+
+    gamma = np.broadcast_to(gamma[..., 0], innov.shape[:-1])
+    out = np.empty_like(innov)
+    for idx in np.ndindex(*innov.shape[:-1]):
+        out[idx] = lfilter([1.], [1., -gamma[idx]], innov[idx])
+    return out
+
+
+def _fit_series(cls, data, param_start, bounds, method, options):
+    """Fit parameters to one series by maximum likelihood.
+
+    Parameters
+    ----------
+    cls : type
+        Model class
+    data : array
+        Standardized residuals
+    param_start : (8, ) array
+        Starting values
+    bounds : sequence
+        Bounds on parameters
+    method : str
+        Optimization method
+    options : dict
+        Optimization options
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization result with NaN in the `cov` attribute
+
+    """
+    res = minimize(cls.loglikelihood, param_start, args=(data,),
+                   method=method, bounds=bounds, options=options)
+    res.cov = np.full((8, 8), np.nan)
+    return res
@@ -0,0 +1,321 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+r"""
+Backtesting with probability integral transform
+===============================================
+
+If standardized residuals :math:`z_{t}` follow the model distribution
+:math:`F`, the probability integral transform (PIT) :math:`u_{t}=F(z_{t})`
+is independent and uniform on (0, 1). The following tests are computed:
+
+- Kolmogorov-Smirnov test of uniformity, evaluated on a histogram of PIT,
+- Kupiec test of unconditional coverage of Value-at-Risk at level
+  :math:`\alpha`, with exceptions :math:`u_{t}<\alpha`,
+- Christoffersen tests of independence and conditional coverage, based on
+  first order transitions between exceptions,
+- Berkowitz likelihood ratio test of :math:`x_{t}=\Phi^{-1}(u_{t})` being
+  independent standard normal against the AR(1) alternative
+
+.. math::
+
+    x_{t}-\mu=\rho\left(x_{t-1}-\mu\right)+\sigma\varepsilon_{t}.
+
+Data is consumed in chunks, and only running statistics are kept: bin
+counts, exception counts, transition counts, and sums of squares and cross
+products of :math:`x_{t}` and :math:`x_{t-1}`. Memory therefore does not
+depend on the length of the sample. Chunks are arrays with time along the
+first axis and any number of independent series along the remaining axes,
+and all statistics are updated vectorized across series.
+
+References
+----------
+
+.. [1] Berkowitz, J. (2001). Testing density forecasts, with applications
+    to risk management. *Journal of Business & Economic Statistics*,
+    19(4), 465–474.
+
+.. [2] Christoffersen, P. F. (1998). Evaluating interval forecasts.
+    *International Economic Review*, 39(4), 841–862.
+
+.. [3] Kupiec, P. H. (1995). Techniques for verifying the accuracy of risk
+    measurement models. *Journal of Derivatives*, 3(2), 73–84.
+
+Examples
+--------
+>>> skewt = SkewStudent(eta=np.array([4., 8., 30.]), lam=-.2)
+>>> data = skewt.rvs(size=(10**6, 3), random_state=0)
+>>> backtest = PITBacktest(alpha=.01)
+>>> backtest.update_stream(skewt, data, chunksize=10**5)
+>>> print(backtest.kupiec()[1])
+[ 0.62725367  0.84097046  0.29140853] #random
+
+"""
+
+from __future__ import print_function, division
+
+import numpy as np
+
+from scipy.special import ndtri, xlogy
+from scipy.stats import chi2, kstwo
+
+from .skewstudent import CHUNKSIZE
+
+__all__ = ['PITBacktest']
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class PITBacktest(object):
+
+    """Streaming PIT backtest of many series.
+
+    Attributes
+    ----------
+    nbins : int
+        Number of histogram bins
+    alpha : float
+        Value-at-Risk level
+    nobs : array
+        Number of observations of each series
+    counts : (nbins, ...) array
+        Histogram of PIT values of each series
+    exceptions : array
+        Number of PIT values below `alpha`
+    transitions : (2, 2, ...) array
+        Number of transitions from no exception (0) or exception (1)
+        to the next observation
+
+    Methods
+    -------
+    update
+        Update statistics with a chunk of residuals
+    update_pit
+        Update statistics with a chunk of PIT values
+    update_stream
+        Update statistics with residuals read in chunks
+    ks
+        Kolmogorov-Smirnov test
+    kupiec
+        Unconditional coverage test
+    christoffersen
+        Independence test
+    conditional_coverage
+        Conditional coverage test
+    berkowitz
+        Likelihood ratio test of normal transformed PIT
+
+    """
+
+    def __init__(self, nbins=100, alpha=.05):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        nbins : int
+            Number of histogram bins. Kolmogorov-Smirnov statistic is
+            evaluated at bin edges.
+        alpha : float
+            Value-at-Risk level
+
+        """
+        self.nbins = nbins
+        self.alpha = alpha
+        self.nobs = None
+
+    def __start(self, shape):
+        """Allocate statistics for series of the given shape.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of one observation of all series
+
+        """
+        self.nobs = np.zeros(shape, dtype=np.int64)
+        self.counts = np.zeros((self.nbins, ) + shape, dtype=np.int64)
+        self.exceptions = np.zeros(shape, dtype=np.int64)
+        self.transitions = np.zeros((2, 2) + shape, dtype=np.int64)
+        # sums of x[t], x[t-1], x[t]**2, x[t-1]**2, x[t]*x[t-1]
+        self.__moments = np.zeros((5, ) + shape)
+        self.__last_hit = None
+        self.__last_normal = None
+
+    def update(self, skewt, resid):
+        """Update statistics with a chunk of residuals.
+
+        Parameters
+        ----------
+        skewt : SkewStudent
+            Model distribution. Parameters broadcast against one
+            observation of all series.
+        resid : array
+            Standardized residuals, time along the first axis
+
+        """
+        self.update_pit(skewt.cdf(resid))
+
+    def update_stream(self, skewt, source, chunksize=CHUNKSIZE,
+                      prefetch=True):
+        """Update statistics with residuals read in chunks.
+
+        Parameters
+        ----------
+        skewt : SkewStudent
+            Model distribution
+        source : array, str or iterable
+            Standardized residuals, see `SkewStudent.stream_cdf`
+        chunksize : int
+            Approximate number of elements in each chunk
+        prefetch : bool
+            Whether to read the next chunk in a background thread
+
+        """
+        for pit in skewt.stream_cdf(source, chunksize, prefetch):
+            self.update_pit(pit)
+
+    def update_pit(self, pit):
+        """Update statistics with a chunk of PIT values.
+
+        Parameters
+        ----------
+        pit : array
+            PIT values in [0, 1], time along the first axis
+
+        """
+        pit = np.asarray(pit, dtype=float)
+        if self.nobs is None:
+            self.__start(pit.shape[1:])
+        if pit.shape[0] == 0:
+            return
+        self.nobs += pit.shape[0]
+
+        bins = np.minimum((pit * self.nbins).astype(np.intp), self.nbins-1)
+        # offset bins of each series to count all of them in one pass
+        series = np.arange(self.exceptions.size).reshape(self.nobs.shape)
+        counts = np.bincount((bins + series * self.nbins).ravel(),
+                             minlength=self.counts.size)
+        self.counts += np.moveaxis(
+            counts.reshape(self.nobs.shape + (self.nbins, )), -1, 0)
+
+        hit = pit < self.alpha
+        self.exceptions += hit.sum(0)
+        if self.__last_hit is not None:
+            hit = np.concatenate([self.__last_hit[np.newaxis], hit])
+        for before, after in np.ndindex(2, 2):
+            self.transitions[before, after] += \
+                ((hit[:-1] == before) & (hit[1:] == after)).sum(0)
+        self.__last_hit = hit[-1]
+
+        # PIT of exactly 0 or 1 would map to infinity
+        tiny = np.finfo(float).tiny
+        normal = ndtri(np.clip(pit, tiny, 1 - np.finfo(float).epsneg))
+        if self.__last_normal is not None:
+            normal = np.concatenate([self.__last_normal[np.newaxis], normal])
+        current, lagged = normal[1:], normal[:-1]
+        self.__moments += [current.sum(0), lagged.sum(0),
+                           (current**2).sum(0), (lagged**2).sum(0),
+                           (current*lagged).sum(0)]
+        self.__last_normal = normal[-1]
+
+    def ks(self):
+        """Kolmogorov-Smirnov test of uniform PIT.
+
+        The statistic is the largest distance between empirical and
+        uniform distribution functions at histogram bin edges. It is a
+        lower bound of the exact statistic, which differs by at most
+        the largest fraction of observations in a single bin.
+
+        Returns
+        -------
+        stat : array
+            Kolmogorov-Smirnov statistic of each series
+        pvalue : array
+            Asymptotically exact p-value
+
+        """
+        edges = np.arange(1, self.nbins+1) / self.nbins
+        edges = edges.reshape((-1, ) + (1, ) * self.nobs.ndim)
+        ecdf = np.cumsum(self.counts, 0) / self.nobs
+        stat = np.abs(ecdf - edges).max(0)
+        return stat, kstwo.sf(stat, self.nobs)
+
+    def kupiec(self):
+        """Kupiec test of unconditional coverage.
+
+        Returns
+        -------
+        stat : array
+            Likelihood ratio statistic of each series
+        pvalue : array
+            Asymptotic p-value, chi-squared with one degree of freedom
+
+        """
+        nobs, hits = self.nobs, self.exceptions
+        share = hits / nobs
+        stat = 2 * (xlogy(hits, share) + xlogy(nobs-hits, 1-share)
+                    - xlogy(hits, self.alpha)
+                    - xlogy(nobs-hits, 1-self.alpha))
+        return stat, chi2.sf(stat, 1)
+
+    def christoffersen(self):
+        """Christoffersen test of independence of exceptions.
+
+        Returns
+        -------
+        stat : array
+            Likelihood ratio statistic of each series
+        pvalue : array
+            Asymptotic p-value, chi-squared with one degree of freedom
+
+        """
+        trans = self.transitions
+        calm, hits = trans[:, 0], trans[:, 1]
+        # probability of an exception after no exception, and after one;
+        # states never visited contribute nothing to the likelihood
+        share = np.divide(hits, calm + hits, out=np.zeros(hits.shape),
+                          where=calm + hits > 0)
+        total = hits.sum(0) / trans.sum((0, 1))
+        stat = 2 * (xlogy(calm, 1-share) + xlogy(hits, share)).sum(0) \
+            - 2 * (xlogy(calm.sum(0), 1-total) + xlogy(hits.sum(0), total))
+        return stat, chi2.sf(stat, 1)
+
+    def conditional_coverage(self):
+        """Christoffersen test of conditional coverage.
+
+        Sum of Kupiec and independence statistics.
+
+        Returns
+        -------
+        stat : array
+            Likelihood ratio statistic of each series
+        pvalue : array
+            Asymptotic p-value, chi-squared with two degrees of freedom
+
+        """
+        stat = self.kupiec()[0] + self.christoffersen()[0]
+        return stat, chi2.sf(stat, 2)
+
+    def berkowitz(self):
+        """Berkowitz likelihood ratio test.
+
+        The AR(1) alternative is estimated by conditional maximum
+        likelihood, which is least squares on the running sums.
+        The first observation is conditioned upon.
+
+        Returns
+        -------
+        stat : array
+            Likelihood ratio statistic of each series
+        pvalue : array
+            Asymptotic p-value, chi-squared with three degrees of freedom
+
+        """
+        nobs = self.nobs - 1
+        current, lagged, current2, lagged2, cross = self.__moments
+        var_lagged = lagged2 - lagged**2 / nobs
+        cov = cross - current * lagged / nobs
+        var_current = current2 - current**2 / nobs
+        sigma2 = (var_current - cov**2 / var_lagged) / nobs
+        stat = current2 - nobs * (np.log(sigma2) + 1)
+        return stat, chi2.sf(stat, 3)
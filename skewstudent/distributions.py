@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+r"""
+Integration with scipy.stats
+============================
+
+Skewed Student distribution as an instance of
+`scipy.stats.rv_continuous`. Density, distribution and quantile functions,
+random variates and the first four moments are all delegated to the
+closed forms of `SkewStudent`. The generic machinery of `scipy.stats`,
+such as frozen distributions, `fit`, `expect`, `interval`, location and
+scale, then runs without numerical integration or root finding.
+
+Shape parameters are degrees of freedom :math:`2<\eta<\infty` and skewness
+:math:`-1<\lambda<1`.
+
+Examples
+--------
+>>> rv = skewt(5, -.3)
+>>> print(rv.cdf([-1, 0, 1]))
+[ 0.13134331  0.44177674  0.88737524]
+
+>>> print(rv.interval(.9))
+(-1.7323796840177323, 1.3336066885956805)
+
+>>> print(skewt.fit(rv.rvs(size=1000, random_state=0)))
+(5.84008038, -0.254639, -0.01443082, 0.94389201) #random
+
+"""
+
+from __future__ import print_function, division
+
+import numpy as np
+
+from scipy.stats import rv_continuous
+
+from .skewstudent import SkewStudent, PARAM_START
+
+__all__ = ['skewt_gen', 'skewt']
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class skewt_gen(rv_continuous):
+
+    """Skewed Student distribution in `scipy.stats` form.
+
+    Shape parameters are `eta` and `lam`, see `SkewStudent`.
+
+    """
+
+    def _argcheck(self, eta, lam):
+        return (eta > 2) & (lam > -1) & (lam < 1)
+
+    def _pdf(self, x, eta, lam):
+        return SkewStudent(eta=eta, lam=lam).pdf(x)
+
+    def _logpdf(self, x, eta, lam):
+        return SkewStudent(eta=eta, lam=lam).logpdf(x)
+
+    def _cdf(self, x, eta, lam):
+        return SkewStudent(eta=eta, lam=lam).cdf(x)
+
+    def _ppf(self, q, eta, lam):
+        return SkewStudent(eta=eta, lam=lam).ppf(q)
+
+    def _rvs(self, eta, lam, size=None, random_state=None):
+        # SkewStudent.rvs collapses a single draw to float
+        rvs = SkewStudent(eta=eta, lam=lam).rvs(size=size,
+                                                random_state=random_state)
+        return np.reshape(rvs, size)
+
+    def _stats(self, eta, lam):
+        skewt = SkewStudent(eta=eta, lam=lam)
+        zeros = np.zeros(np.broadcast(eta, lam).shape)
+        return zeros, zeros + 1, skewt.skewness(), skewt.kurtosis()
+
+    def _fitstart(self, data, args=None):
+        if args is None:
+            args = PARAM_START
+        loc, scale = self._fit_loc_scale_support(data, *args)
+        return tuple(args) + (loc, scale)
+
+
+skewt = skewt_gen(name='skewt', shapes='eta, lam')
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+r"""
+GARCH with Skewed Student innovations
+=====================================
+
+Conditional density model of [1]_ with GARCH(1,1) variance
+
+.. math::
+
+    r_{t}=\sigma_{t}z_{t},\quad
+    \sigma_{t}^{2}=\omega+\alpha r_{t-1}^{2}+\beta\sigma_{t-1}^{2},
+
+where :math:`z_{t}` are independent Skewed Student random variables with
+parameters :math:`\eta` and :math:`\lambda`. Returns are assumed to be
+demeaned. The recursion starts from the sample variance of returns.
+
+The variance recursion is a linear filter, so it is evaluated together with
+its derivatives in a single call to `scipy.signal.lfilter`. Standardized
+residuals go through the Skewed Student log-density in one pass, and the
+gradient of the log-likelihood is computed analytically.
+
+References
+----------
+
+.. [1] Hansen, B. E. (1994). Autoregressive conditional density estimation.
+    *International Economic Review*, 35(3), 705–730.
+
+Examples
+--------
+>>> model = SkewStudentGARCH(omega=.05, alpha=.05, beta=.9, eta=5, lam=-.3)
+>>> returns, variance = model.simulate(2520, random_state=0)
+>>> res = SkewStudentGARCH.fit(returns)
+>>> print(res.x)
+[ 0.04140364  0.04936915  0.90857649  4.88942793 -0.32126353]
+
+"""
+
+from __future__ import print_function, division
+
+import numpy as np
+
+from scipy.optimize import minimize
+from scipy.signal import lfilter
+
+from .skewstudent import (SkewStudent, BOUNDS, _check_random_state,
+                          _dlogpdf_darg, _loglikelihood_derivatives)
+
+__all__ = ['SkewStudentGARCH']
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class SkewStudentGARCH(object):
+
+    """GARCH(1,1) model with Skewed Student innovations.
+
+    Attributes
+    ----------
+    omega : float
+        Intercept of variance. :math:`0 < \\omega`
+    alpha : float
+        Reaction to squared returns. :math:`0 \\leq \\alpha`
+    beta : float
+        Persistence of variance. :math:`0 \\leq \\beta`,
+        :math:`\\alpha + \\beta < 1`
+    eta : float
+        Degrees of freedom. :math:`2 < \\eta < \\infty`
+    lam : float
+        Skewness. :math:`-1 < \\lambda < 1`
+
+    Methods
+    -------
+    variance
+        Conditional variance
+    loglikelihood
+        Negative log-likelihood
+    loglikelihood_and_grad
+        Negative log-likelihood and its gradient
+    fit
+        Maximum likelihood estimation
+    simulate
+        Simulate returns and conditional variance
+
+    """
+
+    def __init__(self, omega=.05, alpha=.05, beta=.9, eta=10., lam=-.1):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        omega : float
+            Intercept of variance
+        alpha : float
+            Reaction to squared returns
+        beta : float
+            Persistence of variance
+        eta : float
+            Degrees of freedom. :math:`2 < \\eta < \\infty`
+        lam : float
+            Skewness. :math:`-1 < \\lambda < 1`
+
+        """
+        self.omega = omega
+        self.alpha = alpha
+        self.beta = beta
+        self.eta = eta
+        self.lam = lam
+
+    @property
+    def param(self):
+        """Parameters (omega, alpha, beta, eta, lam)."""
+        return np.array([self.omega, self.alpha, self.beta,
+                         self.eta, self.lam])
+
+    @staticmethod
+    def variance(param, data, grad=False):
+        """Conditional variance.
+
+        Parameters
+        ----------
+        param : sequence
+            Parameters (omega, alpha, beta, eta, lam)
+        data : array
+            Returns
+        grad : bool
+            Whether to compute derivatives with respect to
+            (omega, alpha, beta)
+
+        Returns
+        -------
+        array
+            Conditional variance. Same shape as the input.
+        (3, nobs) array
+            Derivatives of conditional variance, only if `grad` is True
+
+        """
+        omega, alpha, beta = param[:3]
+        data = np.asarray(data, dtype=float)
+        nobs = data.shape[0]
+        start = data.var()
+
+        innov = np.empty(nobs)
+        innov[0] = start
+        innov[1:] = omega + alpha * data[:-1]**2
+        variance = lfilter([1.], [1., -beta], innov)
+        if not grad:
+            return variance
+
+        innov = np.zeros((3, nobs))
+        innov[0, 1:] = 1
+        innov[1, 1:] = data[:-1]**2
+        innov[2, 1:] = variance[:-1]
+        return variance, lfilter([1.], [1., -beta], innov, axis=-1)
+
+    def loglikelihood(self, param, data):
+        """Negative log-likelihood.
+
+        Parameters
+        ----------
+        param : sequence
+            Parameters (omega, alpha, beta, eta, lam)
+        data : array
+            Returns
+
+        Returns
+        -------
+        float
+            Negative log-likelihood
+
+        Notes
+        -----
+        Parameters of the instance are left unchanged.
+
+        """
+        eta, lam = param[3:]
+        variance = self.variance(param, data)
+        resid = data / variance**.5
+
+        return SkewStudent().loglikelihood([eta, lam], resid) \
+            + .5 * np.log(variance).sum()
+
+    def loglikelihood_and_grad(self, param, data):
+        """Negative log-likelihood and its gradient.
+
+        Suitable for `scipy.optimize.minimize` with ``jac=True``.
+
+        Parameters
+        ----------
+        param : sequence
+            Parameters (omega, alpha, beta, eta, lam)
+        data : array
+            Returns
+
+        Returns
+        -------
+        float
+            Negative log-likelihood
+        (5, ) array
+            Gradient with respect to (omega, alpha, beta, eta, lam)
+
+        """
+        eta, lam = param[3:]
+        variance, dvariance = self.variance(param, data, grad=True)
+        resid = data / variance**.5
+
+        llf, grad, hess = _loglikelihood_derivatives(eta, lam, resid)
+        # derivative of log-likelihood with respect to variance
+        score = -(resid * _dlogpdf_darg(resid, eta, lam) + 1) / variance / 2
+        llf -= .5 * np.log(variance).sum()
+
+        return -llf, -np.concatenate([dvariance.dot(score), grad])
+
+    @classmethod
+    def fit(cls, data, param_start=None, bounds=None, method='SLSQP',
+            options=None):
+        """Fit parameters by maximum likelihood.
+
+        Stationarity :math:`\\alpha + \\beta < 1` is imposed as a constraint.
+        Covariance of the estimator is the inverse of the Hessian obtained
+        by differentiating the analytic gradient numerically.
+
+        Parameters
+        ----------
+        data : array
+            Returns
+        param_start : array, optional
+            Starting values (omega, alpha, beta, eta, lam)
+        bounds : sequence, optional
+            Bounds on parameters passed to `scipy.optimize.minimize`
+        method : str
+            Optimization method passed to `scipy.optimize.minimize`
+        options : dict, optional
+            Options passed to `scipy.optimize.minimize`
+
+        Returns
+        -------
+        OptimizeResult
+            Optimization result with covariance in the `cov` attribute
+
+        """
+        data = np.asarray(data, dtype=float)
+        if param_start is None:
+            param_start = [data.var() * .05, .05, .9, 10., 0.]
+        if bounds is None:
+            bounds = ((1e-8, None), (0., 1.), (0., 1.)) + BOUNDS
+        constraint = {'type': 'ineq',
+                      'fun': lambda param: 1 - 1e-6 - param[1] - param[2],
+                      'jac': lambda param: np.array([0, -1., -1., 0, 0])}
+        model = cls()
+        res = minimize(model.loglikelihood_and_grad, param_start,
+                       args=(data,), jac=True, method=method, bounds=bounds,
+                       constraints=constraint, options=options)
+
+        step = 1e-5 * np.maximum(np.abs(res.x), 1e-3)
+        hess = np.array([(model.loglikelihood_and_grad(res.x + shift, data)[1]
+                          - model.loglikelihood_and_grad(res.x - shift,
+                                                         data)[1]) / 2 / h
+                         for shift, h in zip(np.diag(step), step)])
+        try:
+            res.cov = np.linalg.inv((hess + hess.T) / 2)
+        except np.linalg.LinAlgError:
+            res.cov = np.full((5, 5), np.nan)
+        return res
+
+    def simulate(self, nobs, random_state=None):
+        """Simulate returns and conditional variance.
+
+        Parameters
+        ----------
+        nobs : int
+            Number of observations
+        random_state : None, int, Generator or RandomState
+            Source of randomness, see `SkewStudent.rvs`
+
+        Returns
+        -------
+        returns : array
+        variance : array
+
+        """
+        rng = _check_random_state(random_state)
+        innov = SkewStudent(eta=self.eta, lam=self.lam).rvs(
+            size=nobs, random_state=rng)
+        returns = np.empty(nobs)
+        variance = np.empty(nobs)
+        variance[0] = self.omega / (1 - self.alpha - self.beta)
+        returns[0] = variance[0]**.5 * innov[0]
+        for t in range(1, nobs):
+            variance[t] = self.omega + self.alpha * returns[t-1]**2 \
+                + self.beta * variance[t-1]
+            returns[t] = variance[t]**.5 * innov[t]
+        return returns, variance
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compiled kernels
+================
+
+Optional backend of `SkewStudent` compiled with `numba`. Each kernel makes
+a single pass over the data in parallel over available cores, instead of
+a chain of NumPy expressions.
+
+The module is imported only when the backend is requested, either with
+``SkewStudent(backend='numba')`` or by setting environment variable
+``SKEWSTUDENT_BACKEND=numba``. If `numba` is not installed, `AVAILABLE` is
+False and `SkewStudent` falls back to NumPy.
+
+Kernels take 1-D contiguous arrays and scalar parameters together with
+a, b, and c constants.
+
+"""
+
+from __future__ import print_function, division
+
+import math
+
+try:
+    from numba import njit, prange
+except ImportError:
+    AVAILABLE = False
+else:
+    AVAILABLE = True
+
+__all__ = ['AVAILABLE', 'pdf', 'logpdf', 'loglikelihood']
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+if AVAILABLE:
+
+    @njit(error_model='numpy', cache=True)
+    def _quadratic(arg, a, b, left, right):
+        """Squared standardized argument.
+
+        Scales `left` and `right` are equal to
+        :math:`1/\\left((\\eta-2)(1\\mp\\lambda)^{2}\\right)`.
+
+        """
+        arg = b*arg + a
+        return arg*arg*(left if arg < 0 else right)
+
+    @njit(error_model='numpy', cache=True)
+    def _log1p_quadratic(arg, a, b, left, right):
+        """Logarithm of one plus squared standardized argument.
+
+        Far in the tails, where the square overflows, the logarithm is
+        computed from :math:`\\log|a+bx|` instead.
+
+        """
+        quad = _quadratic(arg, a, b, left, right)
+        if quad < math.inf or not abs(arg) < math.inf:
+            return math.log1p(quad)
+        shifted = arg + a/b
+        logq = 2*(math.log(b) + math.log(abs(shifted))) \
+            + math.log(left if shifted < 0 else right)
+        return logq + math.log1p(math.exp(-logq))
+
+    @njit(error_model='numpy', cache=True)
+    def _scales(eta, lam):
+        """Scales of squared argument on both sides of the mode."""
+        return 1/((eta-2)*(1-lam)**2), 1/((eta-2)*(1+lam)**2)
+
+    @njit(parallel=True, error_model='numpy', cache=True)
+    def pdf(arg, eta, lam, a, b, c, out):
+        """Probability density function (PDF).
+
+        Parameters
+        ----------
+        arg : array
+            Grid of point to evaluate PDF at
+        eta, lam : float
+            Parameters
+        a, b, c : float
+            Constants
+        out : array
+            Output array
+
+        """
+        left, right = _scales(eta, lam)
+        power = -(eta+1)/2
+        for i in prange(arg.shape[0]):
+            out[i] = b*c*(1 + _quadratic(arg[i], a, b, left, right))**power
+
+    @njit(parallel=True, error_model='numpy', cache=True)
+    def logpdf(arg, eta, lam, a, b, c, out):
+        """Natural logarithm of probability density function.
+
+        Parameters
+        ----------
+        arg : array
+            Grid of point to evaluate log-PDF at
+        eta, lam : float
+            Parameters
+        a, b, c : float
+            Constants
+        out : array
+            Output array
+
+        """
+        left, right = _scales(eta, lam)
+        logbc = math.log(b*c)
+        power = (eta+1)/2
+        for i in prange(arg.shape[0]):
+            out[i] = logbc \
+                - power*_log1p_quadratic(arg[i], a, b, left, right)
+
+    @njit(parallel=True, error_model='numpy', cache=True)
+    def loglikelihood(arg, eta, lam, a, b, c):
+        """Log-likelihood without intermediate arrays.
+
+        Parameters
+        ----------
+        arg : array
+            Observations
+        eta, lam : float
+            Parameters
+        a, b, c : float
+            Constants
+
+        Returns
+        -------
+        float
+            Log-likelihood
+
+        """
+        left, right = _scales(eta, lam)
+        total = 0.
+        for i in prange(arg.shape[0]):
+            total += _log1p_quadratic(arg[i], a, b, left, right)
+        return arg.shape[0]*math.log(b*c) - (eta+1)/2*total
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Plotting
+========
+
+Plots of Skewed Student distribution compared to Student t distribution.
+
+The module depends on `matplotlib` and `seaborn`. It is imported only when
+one of the plotting methods of `SkewStudent` is called, so that the core
+package needs nothing but NumPy and SciPy.
+
+Examples
+--------
+>>> from skewstudent import SkewStudent
+>>> from skewstudent.plotting import plot_pdf
+>>> plot_pdf(SkewStudent(eta=3, lam=-.5))
+
+"""
+
+from __future__ import print_function, division
+
+import numpy as np
+import matplotlib.pylab as plt
+import seaborn as sns
+
+from scipy.stats import t
+
+__all__ = ['plot_pdf', 'plot_cdf', 'plot_ppf', 'plot_rvspdf']
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+def plot_pdf(skewt, arg=np.linspace(-2, 2, 100)):
+    """Plot probability density function.
+
+    Parameters
+    ----------
+    skewt : SkewStudent
+        Distribution instance
+    arg : array
+        Grid of point to evaluate PDF at
+
+    """
+    scale = (skewt.eta/(skewt.eta-2))**.5
+    plt.plot(arg, t.pdf(arg, skewt.eta, scale=1/scale),
+             label='t distribution')
+    plt.plot(arg, skewt.pdf(arg), label='skew-t distribution')
+    plt.legend()
+    plt.show()
+
+
+def plot_cdf(skewt, arg=np.linspace(-2, 2, 100)):
+    """Plot cumulative density function.
+
+    Parameters
+    ----------
+    skewt : SkewStudent
+        Distribution instance
+    arg : array
+        Grid of point to evaluate CDF at
+
+    """
+    scale = (skewt.eta/(skewt.eta-2))**.5
+    plt.plot(arg, t.cdf(arg, skewt.eta, scale=1/scale),
+             label='t distribution')
+    plt.plot(arg, skewt.cdf(arg), label='skew-t distribution')
+    plt.legend()
+    plt.show()
+
+
+def plot_ppf(skewt, arg=np.linspace(.01, .99, 100)):
+    """Plot inverse cumulative density function.
+
+    Parameters
+    ----------
+    skewt : SkewStudent
+        Distribution instance
+    arg : array
+        Grid of point to evaluate ICDF at
+
+    """
+    scale = (skewt.eta/(skewt.eta-2))**.5
+    plt.plot(arg, t.ppf(arg, skewt.eta, scale=1/scale),
+             label='t distribution')
+    plt.plot(arg, skewt.ppf(arg), label='skew-t distribution')
+    plt.legend()
+    plt.show()
+
+
+def plot_rvspdf(skewt, arg=np.linspace(-2, 2, 100), size=1000):
+    """Plot kernel density estimate of a random sample.
+
+    Parameters
+    ----------
+    skewt : SkewStudent
+        Distribution instance
+    arg : array
+        Grid of point to evaluate PDF at
+    size : int
+        Size of the random sample
+
+    """
+    rvs = skewt.rvs(size=size)
+    xrange = [arg.min(), arg.max()]
+    sns.kdeplot(rvs, clip=xrange, label='kernel')
+    plt.plot(arg, skewt.pdf(arg), label='true pdf')
+    plt.xlim(xrange)
+    plt.legend()
+    plt.show()
+
+
+if __name__ == '__main__':
+
+    from skewstudent import SkewStudent
+
+    sns.set_context('paper')
+    skewt = SkewStudent(eta=3, lam=-.5)
+    plot_pdf(skewt)
+    plot_cdf(skewt)
+    plot_ppf(skewt)
+    plot_rvspdf(skewt)
@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+r"""
+Monte Carlo scenarios
+=====================
+
+Large arrays of Skewed Student draws are filled in place, block by block.
+The first axis of the output indexes scenarios, and parameters of the
+distribution broadcast against the remaining axes, so that one scenario
+may hold draws for many parameter sets.
+
+Each block of scenarios gets its own stream, spawned from a single
+`numpy.random.SeedSequence`. Blocks are independent of each other, so the
+result depends only on the seed and the block size and is bitwise
+identical for any number of threads. Output may be any writeable
+C-contiguous array, including `numpy.memmap`.
+
+Three kinds of variates are supported:
+
+- pseudo-random draws from `SkewStudent.rvs`,
+- antithetic pairs :math:`F^{-1}(U)` and :math:`F^{-1}(1-U)`, stored in
+  consecutive scenarios,
+- scrambled Sobol points pushed through `SkewStudent.ppf`, one point of
+  dimension equal to the size of a scenario per scenario.
+
+Sobol points of all blocks are drawn in order from a single engine in the
+calling thread, which is cheap next to `SkewStudent.ppf`. Only the
+transformation and the writes run concurrently.
+
+Sobol points keep their balance properties only in blocks of a power of
+two points. With a power of two block size this holds for every full
+block. The last block is shorter unless the number of scenarios is a
+multiple of the block size. The same is true for the only block if there
+are fewer scenarios than the block size, or for an odd number of
+antithetic pairs. Such blocks are still valid consecutive points of the
+sequence, and no warning is issued for them.
+
+Examples
+--------
+>>> skewt = SkewStudent(eta=np.array([4., 8., 30.]), lam=-.2)
+>>> generator = ScenarioGenerator(skewt, seed=0, antithetic=True)
+>>> out = generator.generate(2**20, shape=(3, ), workers=4)
+>>> print(out.mean(0))
+[ -1.52664336e-04   9.24681018e-05   1.58082900e-04]
+
+"""
+
+from __future__ import print_function, division
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+from scipy.stats import qmc
+
+from .skewstudent import BLOCKSIZE
+
+__all__ = ['ScenarioGenerator']
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class ScenarioGenerator(object):
+
+    """Reproducible block-wise generator of Skewed Student scenarios.
+
+    Attributes
+    ----------
+    skewt : SkewStudent
+        Distribution to draw from
+    seed : SeedSequence
+        Root of random streams
+    method : str
+        Either 'pseudo' or 'sobol'
+    antithetic : bool
+        Whether consecutive scenarios are antithetic pairs
+    blocksize : int or None
+        Number of scenarios per block
+
+    Methods
+    -------
+    fill
+        Fill preallocated array with scenarios
+    generate
+        Allocate array, possibly memory-mapped, and fill it
+
+    """
+
+    def __init__(self, skewt, seed=None, method='pseudo', antithetic=False,
+                 blocksize=None):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        skewt : SkewStudent
+            Distribution to draw from
+        seed : None, int or SeedSequence
+            Root of random streams. If None, fresh entropy is drawn once,
+            and all subsequent calls reuse it.
+        method : str
+            Either 'pseudo' or 'sobol'
+        antithetic : bool
+            Whether consecutive scenarios are antithetic pairs
+        blocksize : int, optional
+            Number of scenarios per block. Must be even for antithetic
+            pairs and a power of two for Sobol points. Defaults to a power
+            of two such that a block holds about `BLOCKSIZE` draws.
+
+        """
+        if method not in ('pseudo', 'sobol'):
+            raise ValueError('Unknown method: {}'.format(method))
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        self.skewt = skewt
+        self.seed = seed
+        self.method = method
+        self.antithetic = antithetic
+        self.blocksize = blocksize
+
+    def fill(self, out, workers=None):
+        """Fill preallocated array with scenarios.
+
+        Parameters
+        ----------
+        out : array
+            Writeable C-contiguous array. The first axis indexes scenarios,
+            and parameters must broadcast against the remaining axes.
+        workers : int, optional
+            Number of threads filling blocks concurrently. Does not affect
+            the result.
+
+        Returns
+        -------
+        array
+            The same array `out`
+
+        """
+        if not out.flags.c_contiguous:
+            raise ValueError('Output must be C-contiguous.')
+        shape = out.shape[1:]
+        size = int(np.prod(shape))
+        if np.broadcast(np.empty(shape), self.skewt.eta,
+                        self.skewt.lam).shape != shape:
+            raise ValueError('Parameters do not broadcast against '
+                             'a scenario of shape {}.'.format(shape))
+
+        blocksize = self.blocksize
+        if blocksize is None:
+            blocksize = 2**max(1, int(np.log2(max(1, BLOCKSIZE // size))))
+        if self.antithetic and blocksize % 2:
+            raise ValueError('Antithetic pairs require even block size.')
+
+        # fresh copy of the root, so that repeated calls spawn equal streams
+        root = np.random.SeedSequence(self.seed.entropy,
+                                      spawn_key=self.seed.spawn_key,
+                                      pool_size=self.seed.pool_size)
+        starts = range(0, out.shape[0], blocksize)
+        streams = root.spawn(len(starts))
+        sobol_seed = root.generate_state(4)
+
+        def npoints(start):
+            nrows = min(blocksize, out.shape[0] - start)
+            return nrows - nrows // 2 if self.antithetic else nrows
+
+        def fill_block(task):
+            start, stream, uniform = task
+            block = out[start:start+blocksize]
+            if self.method == 'pseudo' and not self.antithetic:
+                rng = np.random.default_rng(stream)
+                block[...] = self.skewt.rvs(size=block.shape, random_state=rng)
+                return
+
+            nrows = block.shape[0]
+            if uniform is None:
+                uniform = np.random.default_rng(stream).random(
+                    npoints(start)*size)
+            uniform = uniform.reshape((npoints(start), ) + shape)
+
+            if self.antithetic:
+                block[0::2] = self.skewt.ppf(uniform)
+                block[1::2] = self.skewt.ppf(1 - uniform[:nrows // 2])
+            else:
+                block[...] = self.skewt.ppf(uniform)
+
+        if self.method == 'sobol':
+            # one engine advanced block by block in the calling thread
+            points = _sobol(sobol_seed, map(npoints, starts), size)
+        else:
+            points = repeat(None)
+        tasks = zip(starts, streams, points)
+        if workers is None or workers == 1:
+            for task in tasks:
+                fill_block(task)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # bound the number of blocks of points held in memory
+                pending = deque()
+                for task in tasks:
+                    if len(pending) >= 2 * workers:
+                        pending.popleft().result()
+                    pending.append(executor.submit(fill_block, task))
+                for future in pending:
+                    future.result()
+        return out
+
+    def generate(self, nscenarios, shape=(), dtype=float, filename=None,
+                 workers=None):
+        """Allocate array, possibly memory-mapped, and fill it.
+
+        Parameters
+        ----------
+        nscenarios : int
+            Number of scenarios
+        shape : tuple
+            Shape of one scenario
+        dtype : dtype
+            Floating point type of the output
+        filename : str, optional
+            Path of a new ``.npy`` file to memory-map the output to
+        workers : int, optional
+            Number of threads filling blocks concurrently
+
+        Returns
+        -------
+        array or memmap
+            Scenarios of shape ``(nscenarios, ) + shape``
+
+        """
+        shape = (nscenarios, ) + tuple(shape)
+        if filename is None:
+            out = np.empty(shape, dtype=dtype)
+        else:
+            out = np.lib.format.open_memmap(filename, mode='w+', dtype=dtype,
+                                            shape=shape)
+        return self.fill(out, workers=workers)
+
+
+def _sobol(seed, sizes, dim):
+    """Consecutive blocks of a scrambled Sobol sequence.
+
+    Blocks are drawn in order from a single engine, so the cost is linear
+    in the total number of points.
+
+    Parameters
+    ----------
+    seed : array
+        State defining the scrambling
+    sizes : iterable of int
+        Number of points in each block
+    dim : int
+        Dimension of points
+
+    Yields
+    ------
+    (npoints, dim) array
+
+    Notes
+    -----
+    A fresh engine warns if the first draw is not a power of two points.
+    Partial blocks are deliberate, so such a first block is drawn as one
+    point followed by the rest. The points are the same, and no warning
+    is issued.
+
+    """
+    engine = qmc.Sobol(dim, scramble=True, seed=np.random.default_rng(seed))
+    for npoints in sizes:
+        if engine.num_generated == 0 and npoints & (npoints-1):
+            yield np.concatenate([engine.random(1),
+                                  engine.random(npoints-1)])
+        else:
+            yield engine.random(npoints)
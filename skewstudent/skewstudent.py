@@ -61,30 +61,236 @@ Examples
 
 from __future__ import print_function, division
 
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from math import comb, fsum
+from multiprocessing import Pool
+
 import numpy as np
-import matplotlib.pylab as plt
-import seaborn as sns
 
-from scipy.special import gamma
-from scipy.stats import t, uniform
+from scipy.special import betaln, gammaln, polygamma, psi, stdtr, stdtrit
+from scipy.optimize import minimize, OptimizeResult
+
+from .tabulated import quantile_table, student_ppf
 
 __all__ = ['SkewStudent']
 
+BLOCKSIZE = 2**16
+CHUNKSIZE = 2**20
+PARAM_START = (10., 0.)
+BOUNDS = ((2.01, 1e3), (-.999, .999))
+
 __author__ = "Stanislav Khrapov"
 __email__ = "khrapovs@gmail.com"
 
 
+def _constants(eta, lam):
+    """Compute a, b, and c constants.
+
+    Parameters
+    ----------
+    eta : float or array
+        Degrees of freedom. :math:`2 < \\eta < \\infty`
+    lam : float or array
+        Skewness. :math:`-1 < \\lambda < 1`
+
+    Returns
+    -------
+    a : float or array
+    b : float or array
+    c : float or array
+
+    """
+    c = np.exp(gammaln((eta+1)/2) - gammaln(eta/2)) / (np.pi*(eta-2))**.5
+    a = 4*lam*c*(eta-2)/(eta-1)
+    b = (1 + 3*lam**2 - a**2)**.5
+    return a, b, c
+
+
+def _in_support(eta, lam):
+    """Check that parameters are inside the support.
+
+    Parameters
+    ----------
+    eta : float or array
+        Degrees of freedom
+    lam : float or array
+        Skewness
+
+    Returns
+    -------
+    bool
+        Whether :math:`2 < \\eta` and :math:`-1 < \\lambda < 1` for all
+        elements
+
+    """
+    return bool(np.all(np.greater(eta, 2)) and np.all(np.abs(lam) < 1))
+
+
+@lru_cache(maxsize=1024)
+def _cached_constants(eta, lam):
+    """Compute a, b, and c constants with a memo shared across instances.
+
+    Parameters
+    ----------
+    eta : float
+        Degrees of freedom. :math:`2 < \\eta < \\infty`
+    lam : float
+        Skewness. :math:`-1 < \\lambda < 1`
+
+    Returns
+    -------
+    a : float
+    b : float
+    c : float
+
+    """
+    return _constants(eta, lam)
+
+
+def _loglikelihood_derivatives(eta, lam, arg, hessian=False):
+    """Compute log-likelihood with its gradient and, optionally, Hessian.
+
+    All intermediate terms are shared between the log-likelihood and its
+    derivatives. Index 0 corresponds to `eta` and index 1 to `lam`.
+
+    Parameters
+    ----------
+    eta : float
+        Degrees of freedom. :math:`2 < \\eta < \\infty`
+    lam : float
+        Skewness. :math:`-1 < \\lambda < 1`
+    arg : array
+        Observations
+    hessian : bool
+        Whether to compute the Hessian
+
+    Returns
+    -------
+    llf : float
+        Log-likelihood
+    grad : (2, ) array
+        Gradient of the log-likelihood
+    hess : (2, 2) array or None
+        Hessian of the log-likelihood if requested
+
+    """
+    arg = np.asarray(arg, dtype=float)
+    nobs = arg.size
+    a, b, c = _cached_constants(float(eta), float(lam))
+    bsq = b**2
+
+    # log(c) = gammaln((eta+1)/2) - gammaln(eta/2) - log(pi*(eta-2))/2
+    dlc = .5*(psi((eta+1)/2) - psi(eta/2)) - .5/(eta-2)
+    dc = c*dlc
+    # a = 4*lam*c*r with r = (eta-2)/(eta-1)
+    r = (eta-2)/(eta-1)
+    dr = 1/(eta-1)**2
+    dg = dc*r + c*dr
+    da = [4*lam*dg, 4*c*r]
+    # b**2 = 1 + 3*lam**2 - a**2
+    dbsq = [-2*a*da[0], 6*lam - 2*a*da[1]]
+    dlb = [dbsq[0]/bsq/2, dbsq[1]/bsq/2]
+    db = [b*dlb[0], b*dlb[1]]
+
+    sign = np.sign(arg + a/b)
+    den = 1 + sign*lam
+    dden = [0, sign]
+    num = b*arg + a
+    z = num/den
+    dnum = [db[0]*arg + da[0], db[1]*arg + da[1]]
+    dz = [(dnum[k] - z*dden[k])/den for k in range(2)]
+    # q = z**2/h with h = eta-2, exponent m = (eta+1)/2
+    h = eta - 2
+    dh = [1, 0]
+    q = z**2/h
+    dq = [2*z*dz[k]/h - q*dh[k]/h for k in range(2)]
+    dm = [.5, 0]
+    m = (eta+1)/2
+    log1pq = np.log1p(q)
+    sum_log1pq = log1pq.sum()
+    dq1pq = [dq[k]/(1+q) for k in range(2)]
+
+    llf = nobs*(np.log(b) + np.log(c)) - m*sum_log1pq
+    dlc = [dlc, 0]
+    grad = np.array([nobs*(dlb[k] + dlc[k]) - dm[k]*sum_log1pq
+                     - m*dq1pq[k].sum() for k in range(2)])
+
+    if not hessian:
+        return llf, grad, None
+
+    d2lc = .25*(polygamma(1, (eta+1)/2) - polygamma(1, eta/2)) \
+        + .5/(eta-2)**2
+    d2c = c*(d2lc + dlc[0]**2)
+    d2r = -2/(eta-1)**3
+    d2g = d2c*r + 2*dc*dr + c*d2r
+    d2a = [[4*lam*d2g, 4*dg], [4*dg, 0]]
+    d2bsq = [[-2*(da[i]*da[j] + a*d2a[i][j]) for j in range(2)]
+             for i in range(2)]
+    d2bsq[1][1] += 6
+    d2lc = [[d2lc, 0], [0, 0]]
+
+    hess = np.empty((2, 2))
+    for i in range(2):
+        for j in range(i, 2):
+            d2lb = .5*(d2bsq[i][j]/bsq - dbsq[i]*dbsq[j]/bsq**2)
+            d2b = b*(d2lb + dlb[i]*dlb[j])
+            d2num = d2b*arg + d2a[i][j]
+            d2z = d2num/den - (dnum[i]*dden[j] + dnum[j]*dden[i])/den**2 \
+                + 2*num*dden[i]*dden[j]/den**3
+            d2q = 2*(dz[i]*dz[j] + z*d2z)/h \
+                - (dq[i]*dh[j] + dq[j]*dh[i])/h
+            hess[i, j] = nobs*(d2lb + d2lc[i][j]) \
+                - (dm[i]*dq1pq[j] + dm[j]*dq1pq[i]).sum() \
+                - m*(d2q/(1+q) - dq1pq[i]*dq1pq[j]).sum()
+            hess[j, i] = hess[i, j]
+
+    return llf, grad, hess
+
+
+def _dlogpdf_darg(arg, eta, lam):
+    """Derivative of log-PDF with respect to its argument.
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate derivative at
+    eta : float or array
+        Degrees of freedom. :math:`2 < \\eta < \\infty`
+    lam : float or array
+        Skewness. :math:`-1 < \\lambda < 1`
+
+    Returns
+    -------
+    array
+        Derivative values. Same shape as the input.
+
+    """
+    if np.ndim(eta) == 0 and np.ndim(lam) == 0:
+        a, b, c = _cached_constants(float(eta), float(lam))
+    else:
+        a, b, c = _constants(eta, lam)
+    num = b*arg + a
+    scale = (1+np.sign(num)*lam)**2 * (eta-2)
+    return -(eta+1) * b*num / (scale + num**2)
+
+
 class SkewStudent(object):
 
     """Skewed Student distribution class.
 
     Attributes
     ----------
-    eta : float
+    eta : float or array
         Degrees of freedom. :math:`2 < \eta < \infty`
-    lam : float
+    lam : float or array
         Skewness. :math:`-1 < \lambda < 1`
 
+    Array-valued parameters broadcast against each other and against the
+    argument of every method following the usual NumPy rules.
+
     Methods
     -------
     pdf
@@ -93,63 +299,156 @@ class SkewStudent(object):
         Cumulative density function (CDF)
     ppf
         Inverse cumulative density function (ICDF)
+    value_at_risk
+        Lower quantile
+    expected_shortfall
+        Conditional mean below the quantile
+    moment
+        Non-central moment
+    skewness
+        Skewness
+    kurtosis
+        Excess kurtosis
     rvs
         Random variates with mean zero and unit variance
 
     """
 
-    def __init__(self, eta=10., lam=-.1):
+    def __init__(self, eta=10., lam=-.1, backend=None):
         """Initialize the class.
 
         Parameters
         ----------
-        eta : float
+        eta : float or array
             Degrees of freedom. :math:`2 < \eta < \infty`
-        lam : float
+        lam : float or array
             Skewness. :math:`-1 < \lambda < 1`
+        backend : str, optional
+            Either 'numpy' or 'numba'. The latter evaluates `pdf`,
+            `logpdf` and `loglikelihood` for scalar parameters with
+            compiled kernels from `skewstudent.jit` and falls back to
+            NumPy if `numba` is not installed. Defaults to environment
+            variable ``SKEWSTUDENT_BACKEND``, or 'numpy' if it is not set.
+
+        Raises
+        ------
+        ValueError
+            If any `eta` is not greater than 2 or any `lam` is not
+            in (-1, 1)
 
         """
         self.eta = eta
         self.lam = lam
-
-    def __const_a(self):
-        """Compute a constant.
+        self.backend = _check_backend(backend)
+
+    @property
+    def eta(self):
+        """Degrees of freedom."""
+        return self.__eta
+
+    @eta.setter
+    def eta(self, eta):
+        """Set degrees of freedom and invalidate cached constants."""
+        if not np.all(np.greater(eta, 2)):
+            raise ValueError('Degrees of freedom must be greater than 2.')
+        self.__eta = eta
+        self.__abc = None
+        self.__scalar = None
+
+    @property
+    def lam(self):
+        """Skewness."""
+        return self.__lam
+
+    @lam.setter
+    def lam(self, lam):
+        """Set skewness and invalidate cached constants."""
+        if not np.all(np.abs(lam) < 1):
+            raise ValueError('Skewness must be between -1 and 1.')
+        self.__lam = lam
+        self.__abc = None
+        self.__scalar = None
+
+    def __constants(self):
+        """Get a, b, and c constants for current parameters.
+
+        The constants are computed once per parameter set and then reused
+        until either `eta` or `lam` is changed. Array-valued parameters
+        are computed vectorized and bypass the shared memo.
 
         Returns
         -------
-        a : float
+        a : float or array
+        b : float or array
+        c : float or array
 
         """
-        return 4*self.lam*self.__const_c()*(self.eta-2)/(self.eta-1)
+        if self.__abc is None:
+            if np.ndim(self.eta) == 0 and np.ndim(self.lam) == 0:
+                self.__abc = _cached_constants(float(self.eta),
+                                               float(self.lam))
+            else:
+                self.__abc = _constants(np.asarray(self.eta, dtype=float),
+                                        np.asarray(self.lam, dtype=float))
+        return self.__abc
+
+    def __scalar_params(self):
+        """Get parameters and constants as Python floats.
 
-    def __const_b(self):
-        """Compute b constant.
+        Used by the scalar fast path of `pdf`, `logpdf`, `cdf` and `ppf`,
+        which avoids array machinery entirely.
 
         Returns
         -------
-        b : float
+        tuple or None
+            (eta, lam, a, b, c), or None if parameters are arrays
 
         """
-        return (1 + 3*self.lam**2 - self.__const_a()**2)**.5
+        if self.__scalar is None:
+            if np.ndim(self.eta) == 0 and np.ndim(self.lam) == 0:
+                self.__scalar = (float(self.eta), float(self.lam)) \
+                    + tuple(float(const) for const in self.__constants())
+            else:
+                self.__scalar = ()
+        return self.__scalar or None
 
-    def __const_c(self):
-        """Compute c constant.
+    def __quantile_table(self, tol):
+        """Get tabulated quantile function of Student t distribution.
+
+        Tolerance of the table is scaled such that the error of ICDF does
+        not exceed `tol`, and rounded down to a power of two so that
+        similar parameter sets share the same table.
+
+        Parameters
+        ----------
+        tol : float
+            Maximum absolute error of ICDF values
 
         Returns
         -------
-        c : float
+        QuantileTable
 
         """
-        return gamma((self.eta+1)/2) \
-            / ((np.pi*(self.eta-2))**.5*gamma(self.eta/2))
-
-    def pdf(self, arg):
+        if np.ndim(self.eta) > 0:
+            raise ValueError('Tabulated ICDF requires scalar eta.')
+        a, b, c = self.__constants()
+        scale = np.max((1+np.abs(self.lam)) * (1-2/self.eta)**.5 / b)
+        return quantile_table(float(self.eta),
+                              2.**np.floor(np.log2(tol/scale)))
+
+    def pdf(self, arg, out=None, dtype=None):
         """Probability density function (PDF).
 
         Parameters
         ----------
         arg : array
             Grid of point to evaluate PDF at
+        out : array, optional
+            Preallocated array to write PDF values to. Must have the shape
+            of the input broadcast against parameters.
+        dtype : dtype, optional
+            Floating point type of computations and output. Defaults to
+            the type of `out` if given, and to float64 otherwise.
 
         Returns
         -------
@@ -157,38 +456,535 @@ class SkewStudent(object):
             PDF values. Same shape as the input.
 
         """
-        c = self.__const_c()
-        a = self.__const_a()
-        b = self.__const_b()
+        if out is None and dtype is None and isinstance(arg, (float, int)):
+            params = self.__scalar_params()
+            if params is not None:
+                return _scalar_pdf(float(arg), *params)
+        return self.__evaluate(_pdf_kernel, arg, out, dtype, 'pdf')
 
-        return b*c*(1 + 1/(self.eta-2) \
-            *((b*arg+a)/(1+np.sign(arg+a/b)*self.lam))**2)**(-(self.eta+1)/2)
+    def logpdf(self, arg, out=None, dtype=None):
+        """Natural logarithm of probability density function.
 
-    def loglikelihood(self, param, arg):
-        """Probability density function (PDF).
+        Computed directly in log space, hence does not underflow in the
+        extreme tails.
 
         Parameters
         ----------
+        arg : array
+            Grid of point to evaluate log-PDF at
+        out : array, optional
+            Preallocated array to write log-PDF values to. Must have
+            the shape of the input broadcast against parameters.
+        dtype : dtype, optional
+            Floating point type of computations and output. Defaults to
+            the type of `out` if given, and to float64 otherwise.
+
+        Returns
+        -------
+        array
+            Log-PDF values. Same shape as the input.
+
+        """
+        if out is None and dtype is None and isinstance(arg, (float, int)):
+            params = self.__scalar_params()
+            if params is not None:
+                return _scalar_logpdf(float(arg), *params)
+        return self.__evaluate(_logpdf_kernel, arg, out, dtype, 'logpdf')
+
+    def __evaluate(self, kernel, arg, out=None, dtype=None, jit_name=None):
+        """Evaluate elementwise kernel in blocks.
+
+        Input is broadcast against parameters and processed in blocks of
+        `BLOCKSIZE` elements. Kernels work in place on the output block, so
+        temporaries never exceed the block size.
+
+        With 'numba' backend and scalar parameters the compiled kernel
+        `jit_name` from `skewstudent.jit` is used instead.
+
+        Parameters
+        ----------
+        kernel : callable
+            Function with signature ``kernel(arg, eta, lam, a, b, c, out)``
+        arg : array
+            Grid of point to evaluate kernel at
+        out : array, optional
+            Preallocated output array
+        dtype : dtype, optional
+            Floating point type of computations and output
+        jit_name : str, optional
+            Name of compiled kernel
+
+        Returns
+        -------
+        array
+            Kernel values. Same shape as the input.
+
+        """
+        if dtype is None:
+            dtype = float if out is None else out.dtype
+        dtype = np.dtype(dtype)
+        params = [self.eta, self.lam] + list(self.__constants())
+        scalar = [np.ndim(param) == 0 for param in params]
+
+        # compiled kernels do not check bounds, so any other output is
+        # validated and broadcast by the iterator below
+        if self.backend == 'numba' and jit_name is not None and all(scalar) \
+                and (out is None or (out.flags.c_contiguous
+                                     and out.shape == np.shape(arg)
+                                     and out.dtype == dtype)):
+            from . import jit
+            arg = np.asarray(arg, dtype=dtype)
+            if out is None:
+                out = np.empty(arg.shape, dtype=dtype)
+            getattr(jit, jit_name)(np.ravel(arg), *params + [out.reshape(-1)])
+            if out.ndim == 0:
+                return out[()]
+            return out
+        params = [dtype.type(param) if flag else param
+                  for param, flag in zip(params, scalar)]
+        operands = [arg] + [param for param, flag in zip(params, scalar)
+                            if not flag] + [out]
+        op_flags = [['readonly']] * (len(operands)-1) \
+            + [['writeonly', 'allocate', 'no_broadcast']]
+
+        with np.nditer(operands, flags=['external_loop', 'buffered',
+                                        'zerosize_ok'],
+                       op_flags=op_flags, op_dtypes=[dtype]*len(operands),
+                       casting='same_kind', buffersize=BLOCKSIZE) as it:
+            for block in it:
+                arrays = iter(block[1:-1])
+                kernel(block[0], *[param if flag else next(arrays)
+                                   for param, flag in zip(params, scalar)],
+                       out=block[-1])
+            out = it.operands[-1]
+
+        if out.ndim == 0:
+            return out[()]
+        return out
+
+    def loglikelihood(self, param, arg, workers=None):
+        """Negative log-likelihood.
+
+        For scalar parameters the sum is reduced over blocks of
+        `BLOCKSIZE` elements without allocating arrays of the size of
+        the input. Block sums are pairwise and combined exactly.
+
+        Parameters
+        ----------
+        param : sequence
+            Parameters (eta, lam). Each may be a float or an array
+            broadcasting against `arg`
         arg : array
             Grid of point to evaluate PDF at
+        workers : int, optional
+            Number of threads reducing blocks concurrently. Blocks are
+            reduced in the current thread if None or 1.
 
         Returns
         -------
+        float
+            Negative log-likelihood. Infinite for parameters outside of
+            the support, so that optimizers reject them.
+
+        Notes
+        -----
+        Parameters of the instance are left unchanged.
+
+        """
+        eta, lam = param
+        if not _in_support(eta, lam):
+            return np.inf
+
+        skewt = type(self)(eta=eta, lam=lam, backend=self.backend)
+        if np.ndim(eta) > 0 or np.ndim(lam) > 0:
+            return -skewt.logpdf(arg).sum()
+
+        arg = np.ravel(np.asarray(arg, dtype=float))
+        if skewt.backend == 'numba':
+            from . import jit
+            return -jit.loglikelihood(arg, eta, lam, *skewt.__constants())
+
+        return -_logpdf_sum(arg, eta, lam, *skewt.__constants(),
+                            workers=workers)
+
+    def loglikelihood_grid(self, eta, lam, arg, workers=None):
+        """Negative log-likelihood on a grid of parameters.
+
+        Constants are computed vectorized for all pairs of parameters.
+        Observations are sorted once, so that for every pair the branches
+        of the density are two contiguous slices split at :math:`-a/b`.
+        Pairs are processed in blocks sharing one buffer of the size of
+        the input. Useful for profile likelihoods and global starting
+        values of `fit`.
+
+        Parameters
+        ----------
+        eta : 1-D array
+            Degrees of freedom
+        lam : 1-D array
+            Skewness
+        arg : array
+            Observations
+        workers : int, optional
+            Number of threads processing blocks concurrently. Blocks are
+            processed in the current thread if None or 1.
+
+        Returns
+        -------
+        (neta, nlam) array
+            Negative log-likelihood for each pair of `eta` and `lam`.
+            Infinite for pairs outside of the support, as in
+            `loglikelihood`.
+
+        Notes
+        -----
+        Parameters of the instance are left unchanged.
+
+        """
+        eta, lam = np.meshgrid(np.asarray(eta, dtype=float),
+                               np.asarray(lam, dtype=float), indexing='ij')
+        arg = np.sort(np.ravel(np.asarray(arg, dtype=float)))
+
+        return -_loglikelihood_grid(arg, eta.ravel(), lam.ravel(),
+                                    workers=workers).reshape(eta.shape)
+
+    def stream_pdf(self, source, chunksize=CHUNKSIZE, prefetch=True):
+        """Probability density function (PDF) over chunks of data.
+
+        Parameters
+        ----------
+        source : array, str or iterable
+            Data too large to be held in memory. Either an array
+            (possibly `numpy.memmap`), a path to ``.npy`` file which is
+            memory mapped, or an iterable of arrays.
+        chunksize : int
+            Approximate number of elements in each chunk. Arrays are split
+            along the first axis, chunks of iterables are used as is.
+        prefetch : bool
+            Whether to read the next chunk in a background thread while
+            the current one is processed
+
+        Yields
+        ------
         array
-            PDF values. Same shape as the input.
+            PDF values of each chunk
 
         """
-        self.eta, self.lam = param
+        for chunk in _iter_chunks(source, chunksize, prefetch):
+            yield self.pdf(chunk)
 
-        return -np.log(self.pdf(arg)).sum()
+    def stream_logpdf(self, source, chunksize=CHUNKSIZE, prefetch=True):
+        """Natural logarithm of PDF over chunks of data.
 
-    def cdf(self, arg):
+        Parameters
+        ----------
+        source : array, str or iterable
+            Array, path to ``.npy`` file, or iterable of arrays.
+            See `stream_pdf`.
+        chunksize : int
+            Approximate number of elements in each chunk
+        prefetch : bool
+            Whether to read the next chunk in a background thread
+
+        Yields
+        ------
+        array
+            Log-PDF values of each chunk
+
+        """
+        for chunk in _iter_chunks(source, chunksize, prefetch):
+            yield self.logpdf(chunk)
+
+    def stream_cdf(self, source, chunksize=CHUNKSIZE, prefetch=True):
+        """Cumulative density function (CDF) over chunks of data.
+
+        Parameters
+        ----------
+        source : array, str or iterable
+            Array, path to ``.npy`` file, or iterable of arrays.
+            See `stream_pdf`.
+        chunksize : int
+            Approximate number of elements in each chunk
+        prefetch : bool
+            Whether to read the next chunk in a background thread
+
+        Yields
+        ------
+        array
+            CDF values of each chunk
+
+        """
+        for chunk in _iter_chunks(source, chunksize, prefetch):
+            yield self.cdf(chunk)
+
+    def stream_loglikelihood(self, param, source, chunksize=CHUNKSIZE,
+                             prefetch=True):
+        """Negative log-likelihood accumulated over chunks of data.
+
+        Only one chunk is held in memory at a time. Partial sums of chunks
+        are accumulated without loss of precision.
+
+        Parameters
+        ----------
+        param : sequence
+            Parameters (eta, lam)
+        source : array, str or iterable
+            Array, path to ``.npy`` file, or iterable of arrays.
+            See `stream_pdf`.
+        chunksize : int
+            Approximate number of elements in each chunk
+        prefetch : bool
+            Whether to read the next chunk in a background thread
+
+        Returns
+        -------
+        float
+            Negative log-likelihood. Infinite for parameters outside of
+            the support.
+
+        """
+        eta, lam = param
+        if not _in_support(eta, lam):
+            return np.inf
+        skewt = type(self)(eta=eta, lam=lam, backend=self.backend)
+
+        return -fsum(skewt.logpdf(chunk).sum()
+                     for chunk in _iter_chunks(source, chunksize, prefetch))
+
+    def loglikelihood_and_grad(self, param, arg):
+        """Negative log-likelihood and its gradient.
+
+        Suitable for `scipy.optimize.minimize` with ``jac=True``.
+
+        Parameters
+        ----------
+        param : sequence
+            Parameters (eta, lam)
+        arg : array
+            Observations
+
+        Returns
+        -------
+        float
+            Negative log-likelihood. Infinite for parameters outside of
+            the support.
+        (2, ) array
+            Gradient with respect to (eta, lam). NaN for parameters
+            outside of the support.
+
+        """
+        eta, lam = param
+        if not _in_support(eta, lam):
+            return np.inf, np.full(2, np.nan)
+        llf, grad, hess = _loglikelihood_derivatives(eta, lam, arg)
+
+        return -llf, -grad
+
+    def loglikelihood_grad(self, param, arg):
+        """Gradient of negative log-likelihood.
+
+        Parameters
+        ----------
+        param : sequence
+            Parameters (eta, lam)
+        arg : array
+            Observations
+
+        Returns
+        -------
+        (2, ) array
+            Gradient with respect to (eta, lam)
+
+        """
+        return self.loglikelihood_and_grad(param, arg)[1]
+
+    def loglikelihood_hess(self, param, arg):
+        """Hessian of negative log-likelihood.
+
+        The inverse of the Hessian at the optimum estimates the covariance
+        matrix of the maximum likelihood estimator.
+
+        Parameters
+        ----------
+        param : sequence
+            Parameters (eta, lam)
+        arg : array
+            Observations
+
+        Returns
+        -------
+        (2, 2) array
+            Hessian with respect to (eta, lam). NaN for parameters outside
+            of the support.
+
+        """
+        eta, lam = param
+        if not _in_support(eta, lam):
+            return np.full((2, 2), np.nan)
+        llf, grad, hess = _loglikelihood_derivatives(eta, lam, arg,
+                                                     hessian=True)
+
+        return -hess
+
+    @classmethod
+    def fit(cls, data, param_start=None, bounds=None, method='SLSQP',
+            options=None, workers=None, chunksize=None):
+        """Fit parameters by maximum likelihood.
+
+        Uses analytic gradient of the log-likelihood. Covariance of the
+        estimator is the inverse of the analytic Hessian at the optimum.
+
+        Parameters
+        ----------
+        data : array
+            Observations. A 2-D array is treated as a collection of
+            independent series, one per column.
+        param_start : array, optional
+            Starting values (eta, lam), for example estimates from
+            a previous fit. For 2-D data can be of shape (nseries, 2)
+            to warm start each series separately.
+        bounds : sequence, optional
+            Bounds on (eta, lam) passed to `scipy.optimize.minimize`
+        method : str
+            Optimization method passed to `scipy.optimize.minimize`
+        options : dict, optional
+            Options passed to `scipy.optimize.minimize`
+        workers : int, optional
+            Number of worker processes used to fit series of 2-D data.
+            Series are fitted in the current process if None or 1.
+        chunksize : int, optional
+            Number of series sent to a worker at once. By default series
+            are split in about four chunks per worker.
+
+        Returns
+        -------
+        OptimizeResult
+            Optimization result with covariance in the `cov` attribute.
+            For 2-D data, `x`, `cov`, `fun`, `success`, `status` and `nit`
+            are stacked along the first axis, one row per series in
+            the input order.
+
+        Notes
+        -----
+        Each series is fitted independently of the others, so results do
+        not depend on the number of workers or on chunking.
+
+        """
+        data = np.asarray(data, dtype=float)
+        if param_start is None:
+            param_start = PARAM_START
+        if bounds is None:
+            bounds = BOUNDS
+        param_start = np.asarray(param_start, dtype=float)
+
+        if data.ndim == 1:
+            return _fit_series(data, param_start, bounds, method, options)
+
+        nseries = data.shape[1]
+        param_start = np.broadcast_to(param_start, (nseries, 2))
+        tasks = [(data[:, col], param_start[col], bounds, method, options)
+                 for col in range(nseries)]
+
+        if workers is None or workers == 1:
+            results = [_fit_series(*task) for task in tasks]
+        else:
+            if chunksize is None:
+                chunksize = max(1, -(-nseries // (4*workers)))
+            with Pool(processes=workers) as pool:
+                results = pool.starmap(_fit_series, tasks,
+                                       chunksize=chunksize)
+
+        return _stack_results(results)
+
+    @classmethod
+    def fit_rolling(cls, data, window, step=1, expanding=False,
+                    param_start=None, bounds=None, method='SLSQP',
+                    options=None, workers=None):
+        """Fit parameters on rolling or expanding windows.
+
+        Windows are fitted in order, each starting from the optimum of the
+        previous one. Neighbouring windows share most observations, so
+        the previous optimum is typically a few iterations away from the
+        next one. The log-likelihood has no sufficient statistics, so every
+        window is still evaluated on all of its observations.
+
+        Parameters
+        ----------
+        data : array
+            Observations. A 2-D array is treated as a collection of
+            independent series, one per column.
+        window : int
+            Number of observations in a rolling window, or in the first
+            expanding window
+        step : int
+            Number of observations between ends of consecutive windows
+        expanding : bool
+            Whether windows start at the first observation
+        param_start : array, optional
+            Starting values (eta, lam) for the first window. For 2-D data
+            can be of shape (nseries, 2).
+        bounds : sequence, optional
+            Bounds on (eta, lam) passed to `scipy.optimize.minimize`
+        method : str
+            Optimization method passed to `scipy.optimize.minimize`
+        options : dict, optional
+            Options passed to `scipy.optimize.minimize`
+        workers : int, optional
+            Number of worker processes used to fit series of 2-D data.
+            Windows of one series are always fitted sequentially.
+
+        Returns
+        -------
+        OptimizeResult
+            Results stacked over windows: `x` of shape (nwindows, 2),
+            `cov`, `fun`, `success`, `status` and `nit`, and `end` with
+            the index following the last observation of each window.
+            For 2-D data all of them get another leading axis, one row
+            per series.
+
+        """
+        data = np.asarray(data, dtype=float)
+        if param_start is None:
+            param_start = PARAM_START
+        if bounds is None:
+            bounds = BOUNDS
+        param_start = np.asarray(param_start, dtype=float)
+        if not 0 < window <= data.shape[0]:
+            raise ValueError('Window must be between 1 and the number of '
+                             'observations.')
+
+        if data.ndim == 1:
+            return _fit_rolling(data, window, step, expanding, param_start,
+                                bounds, method, options)
+
+        nseries = data.shape[1]
+        param_start = np.broadcast_to(param_start, (nseries, 2))
+        tasks = [(data[:, col], window, step, expanding, param_start[col],
+                  bounds, method, options) for col in range(nseries)]
+
+        if workers is None or workers == 1:
+            results = [_fit_rolling(*task) for task in tasks]
+        else:
+            with Pool(processes=workers) as pool:
+                results = pool.starmap(_fit_rolling, tasks)
+
+        res = _stack_results(results)
+        res.end = results[0].end
+        return res
+
+    def cdf(self, arg, out=None, dtype=None):
         """Cumulative density function (CDF).
 
         Parameters
         ----------
         arg : array
             Grid of point to evaluate CDF at
+        out : array, optional
+            Preallocated array to write CDF values to. Must have the shape
+            of the input broadcast against parameters.
+        dtype : dtype, optional
+            Floating point type of computations and output. Defaults to
+            the type of `out` if given, and to float64 otherwise.
 
         Returns
         -------
@@ -196,22 +992,84 @@ class SkewStudent(object):
             CDF values. Same shape as the input.
 
         """
-        a = self.__const_a()
-        b = self.__const_b()
+        if out is None and dtype is None and isinstance(arg, (float, int)):
+            params = self.__scalar_params()
+            if params is not None:
+                return _scalar_cdf(arg, *params)
+        return self.__evaluate(_cdf_kernel, arg, out, dtype)
+
+    def logcdf(self, arg, out=None, dtype=None):
+        """Natural logarithm of cumulative density function.
+
+        Left tail probabilities come from a series of the incomplete beta
+        function, so they stay accurate far below the smallest positive
+        double. The right tail uses `log1p` of the survival function.
+
+        Parameters
+        ----------
+        arg : array
+            Grid of point to evaluate log-CDF at
+        out : array, optional
+            Preallocated array to write log-CDF values to. Must have
+            the shape of the input broadcast against parameters.
+        dtype : dtype, optional
+            Floating point type of computations and output. Defaults to
+            the type of `out` if given, and to float64 otherwise.
+
+        Returns
+        -------
+        array
+            Log-CDF values. Same shape as the input.
+
+        """
+        return self.__evaluate(_logcdf_kernel, arg, out, dtype)
+
+    def logsf(self, arg, out=None, dtype=None):
+        """Natural logarithm of survival function.
+
+        Mirror image of `logcdf`, accurate far in the right tail.
+
+        Parameters
+        ----------
+        arg : array
+            Grid of point to evaluate log-SF at
+        out : array, optional
+            Preallocated array to write log-SF values to. Must have
+            the shape of the input broadcast against parameters.
+        dtype : dtype, optional
+            Floating point type of computations and output. Defaults to
+            the type of `out` if given, and to float64 otherwise.
 
-        y = (b*arg+a)/(1+np.sign(arg+a/b)*self.lam) * (1-2/self.eta)**(-.5)
-        cond = arg < -a/b
+        Returns
+        -------
+        array
+            Log-SF values. Same shape as the input.
 
-        return cond * (1-self.lam) * t.cdf(y, self.eta) \
-            + ~cond * (-self.lam + (1+self.lam) * t.cdf(y, self.eta))
+        """
+        return self.__evaluate(_logsf_kernel, arg, out, dtype)
 
-    def ppf(self, arg):
+    def ppf(self, arg, out=None, approx=False, tol=1e-10):
         """Inverse cumulative density function (ICDF).
 
+        Each branch of the piecewise ICDF is evaluated only on the part of
+        the grid where it applies.
+
         Parameters
         ----------
         arg : array
             Grid of point to evaluate ICDF at. Must belong to (0, 1)
+        out : array, optional
+            Preallocated array to write ICDF values to. Must have the shape
+            of the input broadcast against parameters.
+        approx : bool
+            Whether to interpolate tabulated quantile function of Student t
+            distribution instead of computing it exactly. The table is
+            built once per `eta` and cached, see `skewstudent.tabulated`.
+            Requires scalar `eta`.
+        tol : float
+            Maximum absolute error of ICDF values if `approx` is True.
+            Tolerances below rounding error of the table raise ValueError,
+            see `skewstudent.tabulated`.
 
         Returns
         -------
@@ -219,33 +1077,194 @@ class SkewStudent(object):
             ICDF values. Same shape as the input.
 
         """
-        arg = np.atleast_1d(arg)
+        if out is None and not approx and isinstance(arg, (float, int)):
+            params = self.__scalar_params()
+            if params is not None:
+                return _scalar_ppf(arg, *params)
+
+        table = self.__quantile_table(tol) if approx else None
+
+        arg = np.atleast_1d(np.asarray(arg, dtype=float))
+        a, b, c = self.__constants()
+        shape = np.broadcast(arg, self.eta, self.lam).shape
+        # a single value is returned as float only if the output is ours
+        collapse = out is None
+        if out is None:
+            out = np.empty(shape)
+        arg = np.broadcast_to(arg, shape)
+        eta, lam, a, b = [_broadcast_param(param, shape)
+                          for param in (self.eta, self.lam, a, b)]
+
+        left = arg < (1-lam)/2
+        right = ~left
+
+        eta_l, lam_l, a_l, b_l = [_take(param, left)
+                                  for param in (eta, lam, a, b)]
+        ppf = _student_ppf(arg[left] / (1-lam_l), eta_l, table)
+        out[left] = (ppf * (1-lam_l) * (1-2/eta_l)**.5 - a_l)/b_l
+
+        eta_r, lam_r, a_r, b_r = [_take(param, right)
+                                  for param in (eta, lam, a, b)]
+        ppf = _student_ppf(.5 + (arg[right] - (1-lam_r)/2) / (1+lam_r),
+                           eta_r, table)
+        out[right] = (ppf * (1+lam_r) * (1-2/eta_r)**.5 - a_r)/b_r
+
+        if collapse and out.shape == (1, ):
+            return float(out[0])
+        else:
+            return out
+
+    def value_at_risk(self, alpha):
+        """Value-at-Risk.
+
+        Lower quantile of the distribution, equal to ``ppf(alpha)``.
+        Named to avoid confusion with variance.
+
+        Parameters
+        ----------
+        alpha : array
+            Tail probabilities. Must belong to (0, 1)
+
+        Returns
+        -------
+        array
+            Value-at-Risk. Same shape as the input.
+
+        """
+        return self.ppf(alpha)
+
+    def expected_shortfall(self, alpha):
+        """Expected Shortfall.
+
+        Conditional mean below the quantile,
+        :math:`E\\left[Y|Y\\leq F^{-1}\\left(\\alpha\\right)\\right]`,
+        in closed form. Each half of the distribution is a scaled half of
+        Student t distribution, for which the partial expectation is
+
+        .. math::
+
+            E\\left[T1\\left\\{T\\leq u\\right\\}\\right]
+                =-\\frac{\\eta+u^{2}}{\\eta-1}f_{t}\\left(u\\right).
+
+        Parameters
+        ----------
+        alpha : array
+            Tail probabilities. Must belong to (0, 1)
+
+        Returns
+        -------
+        array
+            Expected Shortfall. Same shape as the input broadcast against
+            parameters.
+
+        """
+        alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+        quantile = np.atleast_1d(self.ppf(alpha))
+        a, b, c = self.__constants()
+        eta, lam = self.eta, self.lam
+        scale = (1-2/eta)**.5
+        # quantile of a + b*Y, which is a scaled Student t on each half
+        arg = b*quantile + a
+        left = (1-lam) * scale
+        right = (1+lam) * scale
+
+        partial = np.where(
+            arg < 0,
+            (1-lam) * left * _student_partial_mean(arg/left, eta, c),
+            (1-lam) * left * _student_partial_mean(0, eta, c)
+            + (1+lam) * right * (_student_partial_mean(arg/right, eta, c)
+                                 - _student_partial_mean(0, eta, c)))
+        out = (partial/alpha - a) / b
+
+        if out.shape == (1, ):
+            return float(out[0])
+        else:
+            return out
+
+    def moment(self, order):
+        """Non-central moment in closed form.
+
+        Moments of :math:`a+bY` are mixtures of absolute moments of scaled
+        Student t halves,
 
-        a = self.__const_a()
-        b = self.__const_b()
+        .. math::
 
-        cond = arg < (1-self.lam)/2
+            E\\left[\\left(a+bY\\right)^{j}\\right]
+                =\\left(\\frac{\\eta-2}{\\eta}\\right)^{j/2}
+                E\\left|T\\right|^{j}\\frac{\\left(1+\\lambda\\right)^{j+1}
+                +\\left(-1\\right)^{j}\\left(1-\\lambda\\right)^{j+1}}{2},
 
-        ppf1 = t.ppf(arg / (1-self.lam), self.eta)
-        ppf2 = t.ppf(.5 + (arg - (1-self.lam)/2) / (1+self.lam), self.eta)
-        ppf = -999.99*np.ones_like(arg)
-        ppf = np.nan_to_num(ppf1) * cond \
-            + np.nan_to_num(ppf2) * np.logical_not(cond)
-        ppf = (ppf * (1+np.sign(arg-(1-self.lam)/2)*self.lam) \
-            * (1-2/self.eta)**.5 - a)/b
+        and moments of :math:`Y` follow by binomial expansion.
 
-        if ppf.shape == (1, ):
-            return float(ppf)
+        Parameters
+        ----------
+        order : int
+            Order of the moment
+
+        Returns
+        -------
+        float or array
+            Moment. Infinite for even orders not less than `eta`,
+            NaN for odd ones.
+
+        """
+        a, b, c = self.__constants()
+        eta = np.asarray(self.eta, dtype=float)
+        lam = np.asarray(self.lam, dtype=float)
+        scale = (1-2/eta)**.5
+
+        out = 0.
+        for power in range(order+1):
+            # divergent moments are replaced below, avoid inf times zero
+            finite = np.where(eta > power, eta, power+1)
+            raw = _abs_student_moment(power, finite) * scale**power \
+                * ((1+lam)**(power+1) + (-1)**power*(1-lam)**(power+1)) / 2
+            out = out + comb(order, power) * raw * (-a)**(order-power)
+        out = np.where(eta > order, out / b**order,
+                       np.nan if order % 2 else np.inf)
+
+        if out.ndim == 0:
+            return float(out)
         else:
-            return ppf
+            return out
+
+    def skewness(self):
+        """Skewness, equal to the third moment.
+
+        Returns
+        -------
+        float or array
+            Skewness. NaN for :math:`\\eta\\leq3`.
+
+        """
+        return self.moment(3)
+
+    def kurtosis(self):
+        """Excess kurtosis, equal to the fourth moment less three.
 
-    def rvs(self, size=1):
+        Returns
+        -------
+        float or array
+            Excess kurtosis. Infinite for :math:`\\eta\\leq4`.
+
+        """
+        return self.moment(4) - 3
+
+    def rvs(self, size=None, random_state=None):
         """Random variates with mean zero and unit variance.
 
+        Draws are generated directly as a mixture of two scaled halves of
+        Student t distribution. The left half is chosen with probability
+        :math:`(1-\\lambda)/2`.
+
         Parameters
         ----------
         size : int or tuple
-            Size of output array
+            Size of output array. Must broadcast against the shape of
+            parameters. Defaults to the shape of parameters.
+        random_state : None, int, Generator or RandomState
+            Source of randomness. If None, global NumPy random state is
+            used. If int, it seeds a new `numpy.random.Generator`.
 
         Returns
         -------
@@ -253,79 +1272,808 @@ class SkewStudent(object):
             Array of random variates
 
         """
-        return self.ppf(uniform.rvs(size=size))
+        if size is None:
+            size = np.broadcast(self.eta, self.lam).shape or 1
+        rng = _check_random_state(random_state)
+        a, b, c = self.__constants()
+
+        rvs = np.abs(rng.standard_t(self.eta, size=size))
+        left = rng.uniform(size=size) < (1-self.lam)/2
+        rvs *= np.where(left, self.lam-1, self.lam+1) \
+            * ((1-2/self.eta)**.5/b)
+        rvs -= a/b
+
+        if rvs.shape == (1, ):
+            return float(rvs[0])
+        else:
+            return rvs
 
     def plot_pdf(self, arg=np.linspace(-2, 2, 100)):
         """Plot probability density function.
 
+        Requires `matplotlib` and `seaborn`, see `skewstudent.plotting`.
+
         Parameters
         ----------
         arg : array
             Grid of point to evaluate PDF at
 
         """
-        scale = (self.eta/(self.eta-2))**.5
-        plt.plot(arg, t.pdf(arg, self.eta, scale=1/scale),
-                 label='t distribution')
-        plt.plot(arg, self.pdf(arg), label='skew-t distribution')
-        plt.legend()
-        plt.show()
+        from .plotting import plot_pdf
+        plot_pdf(self, arg)
 
     def plot_cdf(self, arg=np.linspace(-2, 2, 100)):
         """Plot cumulative density function.
 
+        Requires `matplotlib` and `seaborn`, see `skewstudent.plotting`.
+
         Parameters
         ----------
         arg : array
             Grid of point to evaluate CDF at
 
         """
-        scale = (self.eta/(self.eta-2))**.5
-        plt.plot(arg, t.cdf(arg, self.eta, scale=1/scale),
-                 label='t distribution')
-        plt.plot(arg, self.cdf(arg), label='skew-t distribution')
-        plt.legend()
-        plt.show()
+        from .plotting import plot_cdf
+        plot_cdf(self, arg)
 
     def plot_ppf(self, arg=np.linspace(.01, .99, 100)):
         """Plot inverse cumulative density function.
 
+        Requires `matplotlib` and `seaborn`, see `skewstudent.plotting`.
+
         Parameters
         ----------
         arg : array
             Grid of point to evaluate ICDF at
 
         """
-        scale = (self.eta/(self.eta-2))**.5
-        plt.plot(arg, t.ppf(arg, self.eta, scale=1/scale),
-                 label='t distribution')
-        plt.plot(arg, self.ppf(arg), label='skew-t distribution')
-        plt.legend()
-        plt.show()
+        from .plotting import plot_ppf
+        plot_ppf(self, arg)
 
     def plot_rvspdf(self, arg=np.linspace(-2, 2, 100), size=1000):
         """Plot kernel density estimate of a random sample.
 
+        Requires `matplotlib` and `seaborn`, see `skewstudent.plotting`.
+
         Parameters
         ----------
         arg : array
-            Grid of point to evaluate ICDF at. Must belong to (0, 1)
+            Grid of point to evaluate PDF at
+        size : int
+            Size of the random sample
 
         """
-        rvs = self.rvs(size=size)
-        xrange = [arg.min(), arg.max()]
-        sns.kdeplot(rvs, clip=xrange, label='kernel')
-        plt.plot(arg, self.pdf(arg), label='true pdf')
-        plt.xlim(xrange)
-        plt.legend()
-        plt.show()
+        from .plotting import plot_rvspdf
+        plot_rvspdf(self, arg, size)
+
+
+def _logpdf_sum(arg, eta, lam, a, b, c, workers=None):
+    """Sum of log-PDF reduced over blocks.
+
+    Parameters
+    ----------
+    arg : 1-D array
+        Observations
+    eta, lam : float
+        Parameters
+    a, b, c : float
+        Constants
+    workers : int, optional
+        Number of threads reducing blocks concurrently
+
+    Returns
+    -------
+    float
+        Sum of log-PDF
+
+    """
+    def block_sum(start):
+        block = arg[start:start+BLOCKSIZE]
+        out = np.empty_like(block)
+        _logpdf_kernel(block, eta, lam, a, b, c, out)
+        return out.sum()
+
+    starts = range(0, arg.size, BLOCKSIZE)
+    if workers is None or workers == 1:
+        return fsum(map(block_sum, starts))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return fsum(executor.map(block_sum, starts))
+
+
+def _loglikelihood_grid(arg, eta, lam, workers=None):
+    """Log-likelihood for many pairs of parameters.
+
+    Parameters
+    ----------
+    arg : 1-D array
+        Sorted observations
+    eta, lam : 1-D array
+        Pairs of parameters
+    workers : int, optional
+        Number of threads processing blocks of pairs concurrently
+
+    Returns
+    -------
+    array
+        Log-likelihood for each pair. Minus infinity for pairs outside of
+        the support.
+
+    """
+    valid = np.greater(eta, 2) & (np.abs(lam) < 1)
+    if not valid.all():
+        out = np.full(eta.shape, -np.inf)
+        out[valid] = _loglikelihood_grid(arg, eta[valid], lam[valid],
+                                         workers=workers)
+        return out
+
+    a, b, c = _constants(eta, lam)
+    shift = a / b
+    split = np.searchsorted(arg, -shift)
+    # squared scale of the left and right branches
+    left = b**2 / (1-lam)**2 / (eta-2)
+    right = b**2 / (1+lam)**2 / (eta-2)
+    out = arg.size * np.log(b*c)
+    nrows = max(1, BLOCKSIZE // max(1, arg.size))
+
+    def block_sum(start):
+        buffer = np.empty_like(arg)
+        for row in range(start, min(start+nrows, eta.size)):
+            np.add(arg, shift[row], out=buffer)
+            np.square(buffer, out=buffer)
+            buffer[:split[row]] *= left[row]
+            buffer[split[row]:] *= right[row]
+            np.log1p(buffer, out=buffer)
+            out[row] -= (eta[row]+1) / 2 * buffer.sum()
+
+    starts = range(0, eta.size, nrows)
+    if workers is None or workers == 1:
+        for start in starts:
+            block_sum(start)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(block_sum, starts))
+    return out
+
+
+def _pdf_kernel(arg, eta, lam, a, b, c, out):
+    """Compute PDF in place.
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate PDF at
+    eta, lam, a, b, c : float or array
+        Parameters and constants broadcasting against `arg`
+    out : array
+        Output array
+
+    """
+    _quadratic_kernel(arg, eta, lam, a, b, out)
+    out += 1
+    np.power(out, -(eta+1)/2, out=out)
+    out *= b*c
+
+
+def _logpdf_kernel(arg, eta, lam, a, b, c, out):
+    """Compute log-PDF in place.
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate log-PDF at
+    eta, lam, a, b, c : float or array
+        Parameters and constants broadcasting against `arg`
+    out : array
+        Output array
+
+    """
+    _log1p_quadratic_kernel(arg, eta, lam, a, b, out)
+    out *= -(eta+1)/2
+    out += np.log(b*c)
+
+
+def _quadratic_kernel(arg, eta, lam, a, b, out):
+    """Compute squared standardized argument in place.
+
+    .. math::
+
+        \\frac{1}{\\eta-2}\\left(\\frac{a+bx}{1\\pm\\lambda}\\right)^{2}
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate at
+    eta, lam, a, b : float or array
+        Parameters and constants broadcasting against `arg`
+    out : array
+        Output array
+
+    """
+    # overflow to inf far in the tails is handled by callers
+    with np.errstate(over='ignore'):
+        np.multiply(arg, b, out=out)
+        out += a
+        out /= 1 + np.sign(out)*lam
+        np.square(out, out=out)
+        out /= eta - 2
+
+
+def _log1p_quadratic_kernel(arg, eta, lam, a, b, out):
+    """Compute logarithm of one plus squared standardized argument in place.
+
+    The squared argument overflows for :math:`|x|` above about 1e154.
+    There the logarithm is recomputed from :math:`\\log|a+bx|`, so that
+    the result stays finite for all finite input.
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate at
+    eta, lam, a, b : float or array
+        Parameters and constants broadcasting against `arg`
+    out : array
+        Output array
+
+    """
+    _quadratic_kernel(arg, eta, lam, a, b, out)
+    np.log1p(out, out=out)
+    tail = out == np.inf
+    if tail.any():
+        out[tail] = _log1p_quadratic_tail(
+            arg[tail], *[_take(param, tail) for param in (eta, lam, a, b)])
+
 
+def _log1p_quadratic_tail(arg, eta, lam, a, b):
+    """Logarithm of one plus squared standardized argument in the tails.
+
+    .. math::
+
+        \\log\\left(1+q\\right)=\\log q+\\log\\left(1+1/q\\right)
+
+    with :math:`\\log q` computed without forming :math:`q`.
+
+    Parameters
+    ----------
+    arg : array
+        Points far from the mode
+    eta, lam, a, b : float or array
+        Parameters and constants broadcasting against `arg`
+
+    Returns
+    -------
+    array
+
+    """
+    shifted = arg + a/b
+    logq = 2 * (np.log(b) + np.log(np.abs(shifted))
+                - np.log1p(np.sign(shifted)*lam)) - np.log(eta-2)
+    return logq + np.log1p(np.exp(-logq))
+
+
+def _cdf_kernel(arg, eta, lam, a, b, c, out):
+    """Compute CDF in place.
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate CDF at
+    eta, lam, a, b, c : float or array
+        Parameters and constants broadcasting against `arg`
+    out : array
+        Output array
+
+    """
+    right, scale = _student_kernel(arg, eta, lam, a, b, out)
+    stdtr(eta, out, out=out)
+    out *= scale
+    out -= right*lam
+
+
+def _scalar_quadratic(arg, eta, lam, a, b):
+    """Squared standardized argument for a single point.
+
+    Parameters
+    ----------
+    arg : float
+        Point to evaluate at
+    eta, lam, a, b : float
+        Parameters and constants
+
+    Returns
+    -------
+    float
+
+    """
+    num = a + b*arg
+    num /= 1 + lam if num >= 0 else 1 - lam
+    # multiplication overflows to inf, unlike the power operator
+    return num*num / (eta-2)
+
+
+def _scalar_pdf(arg, eta, lam, a, b, c):
+    """PDF at a single point."""
+    return b*c * (1 + _scalar_quadratic(arg, eta, lam, a, b))**(-(eta+1)/2)
+
+
+def _scalar_logpdf(arg, eta, lam, a, b, c):
+    """Log-PDF at a single point."""
+    quad = _scalar_quadratic(arg, eta, lam, a, b)
+    if quad == math.inf and abs(arg) < math.inf:
+        shifted = arg + a/b
+        scale = 1 + lam if shifted >= 0 else 1 - lam
+        logq = 2 * (math.log(b) + math.log(abs(shifted)) - math.log(scale)) \
+            - math.log(eta-2)
+        return math.log(b*c) - (eta+1)/2 * (logq + math.log1p(math.exp(-logq)))
+    return math.log(b*c) - (eta+1)/2 * math.log1p(quad)
+
+
+def _scalar_cdf(arg, eta, lam, a, b, c):
+    """CDF at a single point."""
+    num = a + b*arg
+    scale = 1 + lam if num >= 0 else 1 - lam
+    prob = scale * float(stdtr(eta, num / scale / (1-2/eta)**.5))
+    return prob - lam if num >= 0 else prob
+
+
+def _scalar_ppf(arg, eta, lam, a, b, c):
+    """ICDF at a single point."""
+    if arg < (1-lam)/2:
+        scale = 1 - lam
+        prob = arg / scale
+    else:
+        scale = 1 + lam
+        prob = .5 + (arg - (1-lam)/2) / scale
+    quantile = float(stdtrit(eta, prob))
+    if quantile < -1e10 or (quantile == math.inf and prob < .5):
+        # far left tail, see skewstudent.tabulated.student_ppf
+        quantile = float(student_ppf(prob, eta))
+    return (quantile * scale * (1-2/eta)**.5 - a) / b
+
+
+def _student_kernel(arg, eta, lam, a, b, out):
+    """Compute argument of Student t CDF in place.
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate at
+    eta, lam, a, b : float or array
+        Parameters and constants broadcasting against `arg`
+    out : array
+        Output array
+
+    Returns
+    -------
+    right : bool array
+        Whether points belong to the right branch
+    scale : array
+        Branch scale, :math:`1\\pm\\lambda`
+
+    """
+    np.multiply(arg, b, out=out)
+    out += a
+    right = out >= 0
+    scale = np.where(right, 1+lam, 1-lam)
+    out /= scale
+    out *= (1-2/eta)**(-.5)
+    return right, scale
 
-if __name__ == '__main__':
 
-    sns.set_context('paper')
-    skewt = SkewStudent(eta=3, lam=-.5)
-    skewt.plot_pdf()
-    skewt.plot_cdf()
-    skewt.plot_ppf()
-    skewt.plot_rvspdf()
+def _logcdf_kernel(arg, eta, lam, a, b, c, out):
+    """Compute log-CDF in place.
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate log-CDF at
+    eta, lam, a, b, c : float or array
+        Parameters and constants broadcasting against `arg`
+    out : array
+        Output array
+
+    """
+    right, scale = _student_kernel(arg, eta, lam, a, b, out)
+    left = ~right
+    out[left] = np.log(scale[left]) \
+        + _student_logcdf(out[left], _take(eta, left))
+    out[right] = np.log1p(-scale[right]
+                          * stdtr(_take(eta, right), -out[right]))
+
+
+def _logsf_kernel(arg, eta, lam, a, b, c, out):
+    """Compute log-SF in place.
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate log-SF at
+    eta, lam, a, b, c : float or array
+        Parameters and constants broadcasting against `arg`
+    out : array
+        Output array
+
+    """
+    right, scale = _student_kernel(arg, eta, lam, a, b, out)
+    left = ~right
+    out[right] = np.log(scale[right]) \
+        + _student_logcdf(-out[right], _take(eta, right))
+    out[left] = np.log1p(-scale[left] * stdtr(_take(eta, left), out[left]))
+
+
+def _student_logcdf(arg, eta):
+    """Log-CDF of Student t distribution.
+
+    In the left tail, :math:`x<-\\sqrt{\\eta}`, the CDF is
+
+    .. math::
+
+        \\frac{1}{2}I_{z}\\left(\\frac{\\eta}{2},\\frac{1}{2}\\right)
+            =\\frac{z^{\\eta/2}}{\\eta B\\left(\\frac{\\eta}{2},
+            \\frac{1}{2}\\right)}\\sum_{n=0}^{\\infty}
+            \\frac{\\left(1/2\\right)_{n}}{n!}
+            \\frac{\\eta}{\\eta+2n}z^{n},\\quad
+        z=\\frac{\\eta}{\\eta+x^{2}}<\\frac{1}{2},
+
+    and its logarithm is computed without forming :math:`z^{\\eta/2}`.
+    Elsewhere the CDF does not underflow and `stdtr` is used.
+
+    Parameters
+    ----------
+    arg : array
+        Grid of point to evaluate log-CDF at
+    eta : float or array
+        Degrees of freedom. Scalar or of the same shape as `arg`
+
+    Returns
+    -------
+    array
+
+    """
+    out = np.empty_like(arg)
+    tail = arg < -np.sqrt(eta)
+    body = ~tail
+    out[body] = np.log(stdtr(_take(eta, body), arg[body]))
+    if not tail.any():
+        return out
+
+    arg, eta = arg[tail], _take(eta, tail)
+    half = eta / 2
+    # log(eta/(eta+x**2)) without overflow of the square
+    logz = np.log(eta) - 2*np.log(-arg) - np.log1p(eta/arg/arg)
+    ratio = np.exp(logz)
+    power = np.ones_like(arg)
+    total = np.ones_like(arg)
+    for order in range(1, 128):
+        power *= (order-.5) / order * ratio
+        term = power * half / (half+order)
+        total += term
+        if np.all(term < 1e-17 * total):
+            break
+    out[tail] = half*logz - np.log(eta) - betaln(half, .5) + np.log(total)
+    return out
+
+
+def _iter_chunks(source, chunksize=CHUNKSIZE, prefetch=True):
+    """Iterate over chunks of data.
+
+    Parameters
+    ----------
+    source : array, str or iterable
+        Either an array (possibly `numpy.memmap`), a path to ``.npy`` file
+        which is memory mapped, or an iterable of arrays
+    chunksize : int
+        Approximate number of elements in each chunk. Arrays are split
+        along the first axis, chunks of iterables are used as is.
+    prefetch : bool
+        Whether to read the next chunk in a background thread
+
+    Yields
+    ------
+    array
+        Chunk of data
+
+    """
+    if isinstance(source, str):
+        source = np.load(source, mmap_mode='r')
+    if isinstance(source, np.ndarray):
+        rows = max(1, chunksize // max(1, np.prod(source.shape[1:],
+                                                  dtype=int)))
+        chunks = (source[start:start+rows]
+                  for start in range(0, source.shape[0], rows))
+    else:
+        chunks = (np.asarray(chunk) for chunk in source)
+    if not prefetch:
+        for chunk in chunks:
+            yield chunk
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(_read_chunk, chunks)
+        while True:
+            chunk = future.result()
+            if chunk is None:
+                return
+            future = executor.submit(_read_chunk, chunks)
+            yield chunk
+
+
+def _read_chunk(chunks):
+    """Read next chunk into memory.
+
+    Parameters
+    ----------
+    chunks : iterator
+        Iterator over chunks of data
+
+    Returns
+    -------
+    array or None
+        Chunk of data in memory, None if iterator is exhausted
+
+    """
+    chunk = next(chunks, None)
+    if chunk is None:
+        return None
+    return np.array(chunk)
+
+
+def _broadcast_param(param, shape):
+    """Broadcast array-valued parameter to the given shape.
+
+    Parameters
+    ----------
+    param : float or array
+        Parameter
+    shape : tuple
+        Target shape
+
+    Returns
+    -------
+    float or array
+        Scalar parameter unchanged, otherwise a read-only broadcast view
+
+    """
+    if np.ndim(param) == 0:
+        return param
+    return np.broadcast_to(param, shape)
+
+
+def _take(param, mask):
+    """Select elements of array-valued parameter.
+
+    Parameters
+    ----------
+    param : float or array
+        Parameter
+    mask : bool array
+        Elements to select
+
+    Returns
+    -------
+    float or array
+        Scalar parameter unchanged, otherwise selected elements
+
+    """
+    if np.ndim(param) == 0:
+        return param
+    return param[mask]
+
+
+def _student_ppf(prob, eta, table=None):
+    """Inverse cumulative density function of Student t distribution.
+
+    Parameters
+    ----------
+    prob : array
+        Probabilities
+    eta : float or array
+        Degrees of freedom
+    table : QuantileTable, optional
+        Tabulated quantile function to use instead of exact one
+
+    Returns
+    -------
+    array
+
+    """
+    if table is None:
+        return student_ppf(prob, eta)
+    return table.ppf(prob)
+
+
+def _abs_student_moment(order, eta):
+    """Absolute moment of Student t distribution.
+
+    Parameters
+    ----------
+    order : int
+        Order of the moment. Must be less than `eta`
+    eta : float or array
+        Degrees of freedom
+
+    Returns
+    -------
+    float or array
+
+    """
+    if order == 0:
+        return np.ones_like(eta)
+    return np.exp(order/2*np.log(eta) + gammaln((order+1)/2)
+                  + gammaln((eta-order)/2) - gammaln(eta/2)) / np.pi**.5
+
+
+def _student_partial_mean(arg, eta, c):
+    """Partial expectation of Student t distribution below the argument.
+
+    Parameters
+    ----------
+    arg : float or array
+        Upper limit
+    eta : float or array
+        Degrees of freedom
+    c : float or array
+        Constant c of the Skewed Student distribution with the same `eta`
+
+    Returns
+    -------
+    float or array
+
+    """
+    # Student t density is c*sqrt((eta-2)/eta) at zero
+    density = c * (1-2/eta)**.5 * (1+arg**2/eta)**(-(eta+1)/2)
+    return -(eta+arg**2) / (eta-1) * density
+
+
+def _check_backend(backend):
+    """Resolve computational backend.
+
+    Parameters
+    ----------
+    backend : str or None
+        Either 'numpy' or 'numba'. If None, environment variable
+        ``SKEWSTUDENT_BACKEND`` is used, defaulting to 'numpy'.
+
+    Returns
+    -------
+    str
+        'numba' if requested and `numba` is installed, 'numpy' otherwise
+
+    Raises
+    ------
+    ValueError
+        If backend is not recognized
+
+    """
+    if backend is None:
+        backend = os.environ.get('SKEWSTUDENT_BACKEND', 'numpy')
+    if backend not in ('numpy', 'numba'):
+        raise ValueError('Backend must be either numpy or numba.')
+    if backend == 'numba':
+        from . import jit
+        if not jit.AVAILABLE:
+            backend = 'numpy'
+    return backend
+
+
+def _check_random_state(random_state):
+    """Turn seed into a random number generator.
+
+    Parameters
+    ----------
+    random_state : None, int, Generator or RandomState
+        Source of randomness. If None, global NumPy random state is used.
+
+    Returns
+    -------
+    Generator or RandomState
+
+    """
+    if random_state is None:
+        return np.random.mtrand._rand
+    if isinstance(random_state, (np.random.Generator,
+                                 np.random.RandomState)):
+        return random_state
+    return np.random.default_rng(random_state)
+
+
+def _fit_series(data, param_start, bounds, method, options):
+    """Fit parameters to one series by maximum likelihood.
+
+    Parameters
+    ----------
+    data : array
+        Observations
+    param_start : (2, ) array
+        Starting values (eta, lam)
+    bounds : sequence
+        Bounds on (eta, lam)
+    method : str
+        Optimization method
+    options : dict
+        Optimization options
+
+    Returns
+    -------
+    OptimizeResult
+        Optimization result with covariance in the `cov` attribute
+
+    """
+    skewt = SkewStudent()
+    res = minimize(skewt.loglikelihood_and_grad, param_start, args=(data,),
+                   jac=True, method=method, bounds=bounds, options=options)
+    try:
+        res.cov = np.linalg.inv(skewt.loglikelihood_hess(res.x, data))
+    except np.linalg.LinAlgError:
+        res.cov = np.full((2, 2), np.nan)
+    return res
+
+
+def _fit_rolling(data, window, step, expanding, param_start, bounds, method,
+                 options):
+    """Fit parameters to windows of one series with warm starts.
+
+    Parameters
+    ----------
+    data : array
+        Observations
+    window : int
+        Number of observations in a rolling window, or in the first
+        expanding window
+    step : int
+        Number of observations between ends of consecutive windows
+    expanding : bool
+        Whether windows start at the first observation
+    param_start : (2, ) array
+        Starting values (eta, lam) for the first window
+    bounds : sequence
+        Bounds on (eta, lam)
+    method : str
+        Optimization method
+    options : dict
+        Optimization options
+
+    Returns
+    -------
+    OptimizeResult
+        Results stacked over windows with window ends in the `end`
+        attribute
+
+    """
+    ends = np.arange(window, data.shape[0]+1, step)
+    results = []
+    for end in ends:
+        start = 0 if expanding else end - window
+        res = _fit_series(data[start:end], param_start, bounds, method,
+                          options)
+        if res.success:
+            param_start = res.x
+        results.append(res)
+
+    res = _stack_results(results)
+    res.end = ends
+    return res
+
+
+def _stack_results(results):
+    """Stack optimization results of several series.
+
+    Parameters
+    ----------
+    results : list of OptimizeResult
+        Results of individual series
+
+    Returns
+    -------
+    OptimizeResult
+        Results with array attributes stacked along the first axis
+
+    """
+    return OptimizeResult(
+        x=np.array([res.x for res in results]),
+        cov=np.array([res.cov for res in results]),
+        fun=np.array([res.fun for res in results]),
+        success=np.array([res.success for res in results]),
+        status=np.array([res.status for res in results]),
+        nit=np.array([res.get('nit', -1) for res in results]),
+        message=[res.message for res in results])
+
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+r"""
+Tabulated quantile function
+===========================
+
+Quantile function of the standard Student t distribution is interpolated
+with quintic Hermite polynomials on a uniform grid in
+
+.. math::
+
+    v=\log\frac{p}{1-p}.
+
+Exact quantile and its first two derivatives with respect to :math:`v` are
+used at the nodes. The quantile is an odd function of :math:`v`, so only
+:math:`v\geq0` is tabulated. Outside of :math:`|v|<V` the exact quantile is
+computed, which affects a fraction :math:`2/(1+e^{V})` of uniform draws.
+
+The grid is refined until the maximum absolute error, measured on a check
+grid with several points inside each interval, falls below the requested
+tolerance. Rounding limits the error to a few machine epsilons times the
+largest tabulated quantile :math:`|F^{-1}(1/(1+e^{V}))|`. With the default
+range the smallest reachable tolerance is about 1e-12 for :math:`\eta`
+close to 2, 1e-13 for :math:`\eta=3`, and 1e-14 above :math:`\eta=5`.
+A table that cannot reach its tolerance is not returned.
+
+"""
+
+from __future__ import print_function, division
+
+from functools import lru_cache
+
+import numpy as np
+
+from scipy.special import expit, gammaln, logit, stdtrit
+
+__all__ = ['QuantileTable']
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class QuantileTable(object):
+
+    """Tabulated quantile function of Student t distribution.
+
+    Attributes
+    ----------
+    eta : float
+        Degrees of freedom
+    bound : float
+        Tabulated range of the logit of probability
+    step : float
+        Grid step
+    max_error : float
+        Maximum absolute error on the check grid
+
+    Methods
+    -------
+    ppf
+        Inverse cumulative density function (ICDF)
+
+    """
+
+    def __init__(self, eta, tol=1e-10, bound=16., nsteps=64,
+                 max_nsteps=2**16):
+        """Initialize the class.
+
+        Parameters
+        ----------
+        eta : float
+            Degrees of freedom
+        tol : float
+            Target maximum absolute error
+        bound : float
+            Tabulated range of the logit of probability
+        nsteps : int
+            Initial number of grid intervals
+        max_nsteps : int
+            Maximum number of grid intervals
+
+        Raises
+        ------
+        ValueError
+            If the tolerance is not reached with `max_nsteps` intervals
+
+        """
+        self.eta = eta
+        self.bound = bound
+        while True:
+            self.__build(nsteps)
+            self.max_error = self.__check()
+            if self.max_error < tol:
+                break
+            if nsteps >= max_nsteps:
+                raise ValueError('Tolerance {:g} is not reached with {} '
+                                 'intervals, maximum error is {:g}.'
+                                 .format(tol, nsteps, self.max_error))
+            nsteps *= 2
+
+    def __build(self, nsteps):
+        """Compute polynomial coefficients on each grid interval.
+
+        Parameters
+        ----------
+        nsteps : int
+            Number of grid intervals
+
+        """
+        self.step = self.bound / nsteps
+        nodes = np.linspace(0, self.bound, nsteps+1)
+        value, deriv1, deriv2 = self.__exact(nodes)
+        step = self.step
+
+        y0, y1 = value[:-1], value[1:]
+        d0, d1 = step*deriv1[:-1], step*deriv1[1:]
+        s0, s1 = step**2*deriv2[:-1], step**2*deriv2[1:]
+
+        self.coef = np.vstack([
+            y0, d0, s0/2,
+            10*(y1-y0) - 6*d0 - 4*d1 - 1.5*s0 + .5*s1,
+            15*(y0-y1) + 8*d0 + 7*d1 + 1.5*s0 - s1,
+            6*(y1-y0) - 3*(d0+d1) - .5*(s0-s1)])
+
+    def __exact(self, nodes):
+        """Exact quantile and its derivatives with respect to logit.
+
+        Parameters
+        ----------
+        nodes : array
+            Non-negative logits of probability
+
+        Returns
+        -------
+        value : array
+        deriv1 : array
+        deriv2 : array
+
+        """
+        eta = self.eta
+        upper, lower = expit(nodes), expit(-nodes)
+        value = -student_ppf(lower, eta)
+        density = np.exp(gammaln((eta+1)/2) - gammaln(eta/2)) \
+            / (np.pi*eta)**.5 * (1+value**2/eta)**(-(eta+1)/2)
+        dprob = upper*lower
+        deriv1 = dprob / density
+        deriv2 = (lower-upper)*deriv1 \
+            + (eta+1)*value/(eta+value**2)*deriv1**2
+        return value, deriv1, deriv2
+
+    def __check(self, npoints=8):
+        """Measure interpolation error inside each grid interval.
+
+        Parameters
+        ----------
+        npoints : int
+            Number of check points inside each interval
+
+        Returns
+        -------
+        float
+            Maximum absolute error
+
+        """
+        shift = (np.arange(npoints) + .5) / npoints
+        nodes = (np.arange(self.coef.shape[1])[:, np.newaxis]
+                 + shift).ravel() * self.step
+        exact = self.__exact(nodes)[0]
+        return np.abs(self.__interpolate(nodes) - exact).max()
+
+    def __interpolate(self, nodes):
+        """Evaluate interpolating polynomials.
+
+        Parameters
+        ----------
+        nodes : array
+            Non-negative logits of probability inside the tabulated range
+
+        Returns
+        -------
+        array
+
+        """
+        pos = nodes / self.step
+        idx = pos.astype(np.intp)
+        np.minimum(idx, self.coef.shape[1]-1, out=idx)
+        pos -= idx
+        value = np.take(self.coef[5], idx)
+        value *= pos
+        for power in range(4, 0, -1):
+            value += np.take(self.coef[power], idx)
+            value *= pos
+        value += np.take(self.coef[0], idx)
+        return value
+
+    def ppf(self, arg, out=None):
+        """Inverse cumulative density function (ICDF).
+
+        Parameters
+        ----------
+        arg : array
+            Grid of point to evaluate ICDF at. Must belong to (0, 1)
+        out : array, optional
+            Preallocated array to write ICDF values to
+
+        Returns
+        -------
+        array
+            ICDF values. Same shape as the input.
+
+        """
+        arg = np.asarray(arg, dtype=float)
+        if out is None:
+            out = np.empty(arg.shape)
+        nodes = logit(arg)
+        absnodes = np.abs(nodes)
+        outside = ~(absnodes < self.bound)
+        np.fmin(absnodes, self.bound, out=absnodes)
+        np.copysign(self.__interpolate(absnodes), nodes, out=out)
+        if outside.any():
+            out[outside] = student_ppf(arg[outside], self.eta)
+        return out
+
+
+@lru_cache(maxsize=64)
+def quantile_table(eta, tol=1e-10):
+    """Get tabulated quantile function shared across instances.
+
+    Parameters
+    ----------
+    eta : float
+        Degrees of freedom
+    tol : float
+        Target maximum absolute error
+
+    Returns
+    -------
+    QuantileTable
+
+    """
+    return QuantileTable(eta, tol=tol)
+
+
+def student_ppf(prob, eta):
+    """Exact quantile function of Student t distribution.
+
+    Calls `scipy.special.stdtrit` directly. Far in the left tail it loses
+    accuracy for small degrees of freedom and eventually returns positive
+    infinity, as it does at zero. Quantiles beyond :math:`-10^{10}` are
+    therefore replaced by the leading term of the tail expansion
+
+    .. math::
+
+        F\\left(x\\right)\\approx
+            \\frac{\\Gamma\\left(\\frac{\\eta+1}{2}\\right)
+            \\eta^{\\left(\\eta-1\\right)/2}}
+            {\\sqrt{\\pi\\eta}\\Gamma\\left(\\frac{\\eta}{2}\\right)}
+            \\left|x\\right|^{-\\eta},
+
+    which is exact to double precision there.
+
+    Parameters
+    ----------
+    prob : array
+        Probabilities
+    eta : float or array
+        Degrees of freedom. Scalar or of the same shape as `prob`
+
+    Returns
+    -------
+    array
+
+    """
+    prob = np.asarray(prob, dtype=float)
+    out = np.asarray(stdtrit(eta, prob))
+    tail = (out < -1e10) | ((out == np.inf) & (prob < .5))
+    if tail.any():
+        eta = eta[tail] if np.ndim(eta) > 0 else eta
+        with np.errstate(divide='ignore'):
+            logprob = np.log(prob[tail])
+        out[tail] = -np.exp((gammaln((eta+1)/2) - gammaln(eta/2)
+                             - .5*np.log(np.pi*eta) + (eta-1)/2*np.log(eta)
+                             - logprob) / eta)
+    return out
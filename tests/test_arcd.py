@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Testing suite for SkewStudentARCD class.
+
+"""
+from __future__ import print_function, division
+
+import unittest as ut
+import numpy as np
+
+from skewstudent import SkewStudent, SkewStudentARCD
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class SkewStudentARCDTestCase(ut.TestCase):
+
+    """Test SkewStudentARCD class."""
+
+    def setUp(self):
+        self.param = np.array([.5, 0, -.3, .4, -.5, .3, 0, .5])
+        self.data = SkewStudentARCD.simulate(self.param, 500, nseries=3,
+                                             random_state=0)
+
+    def test_simulate(self):
+        """Test simulate method."""
+
+        self.assertEqual(self.data.shape, (3, 500))
+        data = SkewStudentARCD.simulate(self.param, 500, random_state=0)
+        self.assertEqual(data.shape, (500, ))
+        np.testing.assert_array_equal(
+            data, SkewStudentARCD.simulate(self.param, 500, random_state=0))
+
+    def test_dynamics(self):
+        """Test recursions of eta and lam."""
+
+        param, data = self.param, self.data[1]
+        state = np.empty((2, data.shape[0]))
+        state[:, 0] = param[[0, 4]] / (1 - param[[3, 7]])
+        for t in range(1, data.shape[0]):
+            state[:, t] = param[[0, 4]] + param[[1, 5]] * data[t-1] \
+                + param[[2, 6]] * abs(data[t-1]) \
+                + param[[3, 7]] * state[:, t-1]
+        eta_min, eta_max = SkewStudentARCD.eta_bounds
+        lam_min, lam_max = SkewStudentARCD.lam_bounds
+        state = 1 / (1 + np.exp(-state))
+
+        eta, lam = SkewStudentARCD.dynamics(param, data)
+
+        np.testing.assert_allclose(eta, eta_min + (eta_max-eta_min)*state[0])
+        np.testing.assert_allclose(lam, lam_min + (lam_max-lam_min)*state[1])
+
+        eta, lam = SkewStudentARCD.dynamics(param, self.data)
+
+        self.assertEqual(eta.shape, self.data.shape)
+        self.assertTrue(np.all((eta > eta_min) & (eta < eta_max)))
+        self.assertTrue(np.all((lam > lam_min) & (lam < lam_max)))
+
+        rows = np.tile(param, (3, 1))
+        for out, expect in zip(SkewStudentARCD.dynamics(rows, self.data),
+                               (eta, lam)):
+            np.testing.assert_allclose(out, expect)
+
+    def test_loglikelihood(self):
+        """Test log-likelihood of several series."""
+
+        llf = SkewStudentARCD.loglikelihood(self.param, self.data)
+
+        self.assertEqual(llf.shape, (3, ))
+        for series, value in zip(self.data, llf):
+            eta, lam = SkewStudentARCD.dynamics(self.param, series)
+            expect = -sum(SkewStudent(eta=e, lam=l).logpdf(x)
+                          for x, e, l in zip(series, eta, lam))
+            self.assertAlmostEqual(value, expect, places=6)
+
+        param = np.tile(self.param, (3, 1))
+        param[1, 0] += .1
+        llf[1] = SkewStudentARCD.loglikelihood(param[1], self.data[1])
+        np.testing.assert_allclose(
+            SkewStudentARCD.loglikelihood(param, self.data), llf)
+
+    def test_fit(self):
+        """Test fit method."""
+
+        res = SkewStudentARCD.fit(self.data[0])
+
+        self.assertTrue(res.success)
+        self.assertEqual(res.x.shape, (8, ))
+        self.assertLessEqual(res.fun, SkewStudentARCD.loglikelihood(
+            np.zeros(8), self.data[0]))
+
+        res = SkewStudentARCD.fit(self.data[:2])
+
+        self.assertEqual(res.x.shape, (2, 8))
+        self.assertEqual(res.fun.shape, (2, ))
+
+
+if __name__ == '__main__':
+    ut.main()
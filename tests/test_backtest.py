@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Testing suite for PITBacktest class.
+
+"""
+from __future__ import print_function, division
+
+import unittest as ut
+import numpy as np
+from scipy.special import ndtri, xlogy
+from scipy.stats import kstest, chi2
+
+from skewstudent import SkewStudent, PITBacktest
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class PITBacktestTestCase(ut.TestCase):
+
+    """Test PITBacktest class."""
+
+    def setUp(self):
+        self.skewt = SkewStudent(eta=np.array([4., 8., 30.]), lam=-.2)
+        self.data = self.skewt.rvs(size=(10000, 3),
+                                   random_state=np.random.default_rng(0))
+
+    def test_chunks(self):
+        """Test equality of chunked and one-shot statistics."""
+
+        whole = PITBacktest(alpha=.1)
+        whole.update(self.skewt, self.data)
+        chunked = PITBacktest(alpha=.1)
+        chunked.update_stream(self.skewt, self.data, chunksize=999)
+        uneven = PITBacktest(alpha=.1)
+        uneven.update_stream(self.skewt, iter([self.data[:1],
+                                               self.data[1:5000],
+                                               self.data[5000:]]))
+
+        np.testing.assert_array_equal(whole.nobs, [10000] * 3)
+        self.assertEqual(whole.counts.shape, (100, 3))
+        np.testing.assert_array_equal(whole.counts.sum(0), whole.nobs)
+        for backtest in (chunked, uneven):
+            np.testing.assert_array_equal(backtest.counts, whole.counts)
+            np.testing.assert_array_equal(backtest.transitions,
+                                          whole.transitions)
+            for test in ('ks', 'kupiec', 'christoffersen',
+                         'conditional_coverage', 'berkowitz'):
+                np.testing.assert_allclose(getattr(backtest, test)(),
+                                           getattr(whole, test)())
+
+    def test_tests(self):
+        """Test statistics against direct computation."""
+
+        backtest = PITBacktest(alpha=.05)
+        backtest.update(self.skewt, self.data)
+        pit = self.skewt.cdf(self.data)
+
+        stat, pvalue = backtest.ks()
+        for series in range(3):
+            exact = kstest(pit[:, series], 'uniform')
+            self.assertLessEqual(stat[series], exact.statistic)
+            self.assertGreater(stat[series], exact.statistic - .01)
+        self.assertTrue(np.all(pvalue > .001))
+
+        hits = pit < .05
+        nobs, count = 10000, hits.sum(0)
+        share = count / nobs
+        stat = 2 * (xlogy(count, share) + xlogy(nobs-count, 1-share)
+                    - count * np.log(.05) - (nobs-count) * np.log(.95))
+        np.testing.assert_allclose(backtest.kupiec()[0], stat)
+
+        for series in range(3):
+            lag, hit = hits[:-1, series], hits[1:, series]
+            n01, n11 = (~lag & hit).sum(), (lag & hit).sum()
+            n00, n10 = (~lag & ~hit).sum(), (lag & ~hit).sum()
+            pi01, pi11 = n01 / (n00+n01), n11 / (n10+n11)
+            pi = (n01+n11) / (nobs-1)
+            stat = 2 * (xlogy(n00, 1-pi01) + xlogy(n01, pi01)
+                        + xlogy(n10, 1-pi11) + xlogy(n11, pi11)
+                        - xlogy(n00+n10, 1-pi) - xlogy(n01+n11, pi))
+            self.assertAlmostEqual(backtest.christoffersen()[0][series], stat)
+
+        np.testing.assert_allclose(backtest.conditional_coverage()[0],
+                                   backtest.kupiec()[0]
+                                   + backtest.christoffersen()[0])
+
+        normal = ndtri(pit)
+        for series in range(3):
+            lag, current = normal[:-1, series], normal[1:, series]
+            design = np.column_stack([np.ones_like(lag), lag])
+            coef = np.linalg.lstsq(design, current, rcond=None)[0]
+            sigma2 = ((current - design.dot(coef))**2).mean()
+            stat = (current**2).sum() - current.size * (np.log(sigma2) + 1)
+            self.assertAlmostEqual(backtest.berkowitz()[0][series], stat,
+                                   places=6)
+            self.assertAlmostEqual(backtest.berkowitz()[1][series],
+                                   chi2.sf(stat, 3), places=6)
+
+    def test_power(self):
+        """Test rejection of misspecified model."""
+
+        backtest = PITBacktest(alpha=.05)
+        backtest.update(SkewStudent(eta=30., lam=.3), self.data)
+        for test in ('ks', 'kupiec', 'conditional_coverage', 'berkowitz'):
+            self.assertTrue(np.all(getattr(backtest, test)()[1] < .01), test)
+
+        # persistent exceptions
+        pit = np.full((1000, 2), .5)
+        pit[100:150] = .01
+        backtest = PITBacktest(alpha=.05)
+        backtest.update_pit(pit)
+        self.assertTrue(np.all(backtest.christoffersen()[1] < .01))
+        self.assertTrue(np.all(np.isfinite(backtest.berkowitz()[0])))
+
+    def test_no_exceptions(self):
+        """Test series without exceptions before the last observation."""
+
+        pit = np.linspace(.02, .98, 50)[:, np.newaxis]
+        pit = np.hstack([pit, pit[::-1]])
+        backtest = PITBacktest(alpha=.01)
+        with np.errstate(all='raise'):
+            backtest.update_pit(pit)
+            for test in ('christoffersen', 'conditional_coverage'):
+                stat, pvalue = getattr(backtest, test)()
+                self.assertTrue(np.all(np.isfinite(stat)), test)
+                self.assertTrue(np.all(np.isfinite(pvalue)), test)
+        np.testing.assert_array_equal(backtest.christoffersen()[0], 0)
+
+
+if __name__ == '__main__':
+
+    ut.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Testing suite for scipy.stats version of Skewed Student distribution.
+
+"""
+from __future__ import print_function, division
+
+import unittest as ut
+import numpy as np
+
+from skewstudent import SkewStudent, skewt
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class SkewtGenTestCase(ut.TestCase):
+
+    """Test skewt_gen class."""
+
+    def test_methods(self):
+        """Test agreement with SkewStudent."""
+
+        eta, lam = 5., -.3
+        skewstudent = SkewStudent(eta=eta, lam=lam)
+        rv = skewt(eta, lam)
+        arg = np.linspace(-3, 3, 11)
+        prob = np.linspace(.01, .99, 11)
+
+        np.testing.assert_allclose(rv.pdf(arg), skewstudent.pdf(arg))
+        np.testing.assert_allclose(rv.logpdf(arg), skewstudent.logpdf(arg))
+        np.testing.assert_allclose(rv.cdf(arg), skewstudent.cdf(arg))
+        np.testing.assert_allclose(rv.ppf(prob), skewstudent.ppf(prob))
+        np.testing.assert_allclose(rv.stats('mvsk'),
+                                   [0, 1, skewstudent.skewness(),
+                                    skewstudent.kurtosis()])
+        np.testing.assert_allclose(
+            rv.rvs(size=10, random_state=np.random.default_rng(0)),
+            skewstudent.rvs(size=10, random_state=0))
+        for size in [1, (1, ), (1, 1), (2, 3)]:
+            draws = skewt.rvs(eta, lam, size=size, random_state=0)
+            self.assertIsInstance(draws, np.ndarray)
+            self.assertEqual(draws.shape, np.empty(size).shape)
+        self.assertIsInstance(skewt.rvs(eta, lam, random_state=0), float)
+
+        np.testing.assert_allclose(skewt.pdf(arg, eta, lam, loc=1, scale=2),
+                                   skewstudent.pdf((arg-1)/2) / 2)
+        np.testing.assert_allclose(
+            skewt.cdf(0, [3., 5.], [.2, -.3]),
+            [SkewStudent(eta=3., lam=.2).cdf(0), skewstudent.cdf(0)])
+
+    def test_generic(self):
+        """Test generic scipy.stats machinery."""
+
+        rv = skewt(5., -.3)
+        lower, upper = rv.interval(.9)
+
+        self.assertAlmostEqual(rv.cdf(lower), .05)
+        self.assertAlmostEqual(rv.sf(upper), .05)
+        self.assertAlmostEqual(rv.expect(lambda arg: arg**2), 1)
+        self.assertTrue(np.isnan(skewt.pdf(0, 2., 0)))
+        self.assertTrue(np.isnan(skewt.pdf(0, 5., 1.)))
+
+    def test_fit(self):
+        """Test fit method."""
+
+        data = skewt.rvs(5., -.3, size=2000, random_state=0)
+        eta, lam, loc, scale = skewt.fit(data)
+
+        self.assertAlmostEqual(eta, 5., delta=1.5)
+        self.assertAlmostEqual(lam, -.3, delta=.1)
+        self.assertAlmostEqual(loc, 0, delta=.1)
+        self.assertAlmostEqual(scale, 1, delta=.1)
+
+
+if __name__ == '__main__':
+    ut.main()
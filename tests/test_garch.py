@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Testing suite for SkewStudentGARCH class.
+
+"""
+from __future__ import print_function, division
+
+import unittest as ut
+import numpy as np
+
+from skewstudent import SkewStudent, SkewStudentGARCH
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class SkewStudentGARCHTestCase(ut.TestCase):
+
+    """Test SkewStudentGARCH class."""
+
+    def setUp(self):
+        self.model = SkewStudentGARCH(omega=.05, alpha=.05, beta=.9,
+                                      eta=5., lam=-.3)
+        self.data, self.variance = self.model.simulate(2000, random_state=0)
+
+    def test_simulate(self):
+        """Test simulate method."""
+
+        self.assertEqual(self.data.shape, (2000, ))
+        self.assertEqual(self.variance.shape, (2000, ))
+        self.assertTrue(np.all(self.variance > 0))
+
+    def test_variance(self):
+        """Test variance recursion."""
+
+        param = self.model.param
+        data = self.data
+        variance = np.empty_like(data)
+        variance[0] = data.var()
+        for t in range(1, data.shape[0]):
+            variance[t] = param[0] + param[1] * data[t-1]**2 \
+                + param[2] * variance[t-1]
+
+        np.testing.assert_allclose(self.model.variance(param, data),
+                                   variance)
+
+    def test_loglikelihood(self):
+        """Test log-likelihood and its gradient."""
+
+        param = self.model.param + np.array([.01, .02, -.03, 1., .1])
+        data = self.data
+        variance = self.model.variance(param, data)
+        skewt = SkewStudent(eta=param[3], lam=param[4])
+        llf = -(skewt.logpdf(data / variance**.5)
+                - .5 * np.log(variance)).sum()
+
+        self.assertAlmostEqual(self.model.loglikelihood(param, data), llf)
+
+        llf, grad = self.model.loglikelihood_and_grad(param, data)
+        step = 1e-6
+        numgrad = [(self.model.loglikelihood(param + shift, data)
+                    - self.model.loglikelihood(param - shift, data))
+                   / (2 * step) for shift in np.eye(5) * step]
+
+        self.assertAlmostEqual(llf, self.model.loglikelihood(param, data))
+        np.testing.assert_allclose(grad, numgrad, rtol=1e-5)
+
+    def test_fit(self):
+        """Test fit method."""
+
+        res = SkewStudentGARCH.fit(self.data)
+
+        self.assertTrue(res.success)
+        self.assertEqual(res.x.shape, (5, ))
+        self.assertEqual(res.cov.shape, (5, 5))
+        self.assertLess(res.x[1] + res.x[2], 1)
+        np.testing.assert_allclose(res.x[1:], self.model.param[1:],
+                                   rtol=.3, atol=.1)
+        self.assertTrue(np.all(np.diag(res.cov) > 0))
+
+
+if __name__ == '__main__':
+    ut.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Testing suite for ScenarioGenerator class.
+
+"""
+from __future__ import print_function, division
+
+import os
+import tempfile
+import unittest as ut
+import warnings
+import numpy as np
+from scipy.stats import kstest
+
+from skewstudent import SkewStudent, ScenarioGenerator
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class ScenarioGeneratorTestCase(ut.TestCase):
+
+    """Test ScenarioGenerator class."""
+
+    def setUp(self):
+        self.skewt = SkewStudent(eta=np.array([4., 30.]), lam=-.3)
+
+    def test_reproducible(self):
+        """Test independence of results from threads and repeated calls."""
+
+        for method, antithetic in [('pseudo', False), ('pseudo', True),
+                                   ('sobol', False), ('sobol', True)]:
+            generator = ScenarioGenerator(self.skewt, seed=0, method=method,
+                                          antithetic=antithetic, blocksize=64)
+            out = generator.generate(1000, shape=(2, ))
+
+            self.assertEqual(out.shape, (1000, 2))
+            self.assertTrue(np.all(np.isfinite(out)))
+            np.testing.assert_array_equal(
+                out, generator.generate(1000, shape=(2, ), workers=4))
+            np.testing.assert_array_equal(
+                out, generator.fill(np.empty((1000, 2)), workers=3))
+
+            other = ScenarioGenerator(self.skewt, seed=1, method=method,
+                                      antithetic=antithetic, blocksize=64)
+            self.assertFalse(np.array_equal(out, other.generate(1000, (2, ))))
+
+        generator = ScenarioGenerator(self.skewt, seed=0, blocksize=64)
+        out = generator.generate(1000, shape=(2, ))
+        rng = np.random.default_rng(np.random.SeedSequence(0).spawn(2)[1])
+        np.testing.assert_array_equal(
+            out[64:128], self.skewt.rvs(size=(64, 2), random_state=rng))
+
+    def test_variates(self):
+        """Test distribution of variates."""
+
+        skewt = SkewStudent(eta=5., lam=-.3)
+        for method, antithetic in [('pseudo', False), ('pseudo', True),
+                                   ('sobol', False)]:
+            generator = ScenarioGenerator(skewt, seed=0, method=method,
+                                          antithetic=antithetic)
+            out = generator.generate(2**14)
+
+            self.assertGreater(kstest(out, skewt.cdf).pvalue, .01)
+
+        generator = ScenarioGenerator(skewt, seed=0, antithetic=True)
+        out = generator.generate(1001, shape=(1, ))
+        np.testing.assert_allclose(skewt.cdf(out[0::2][:500])
+                                   + skewt.cdf(out[1::2]), 1)
+
+        generator = ScenarioGenerator(skewt, seed=0, method='sobol')
+        error = abs(generator.generate(2**12).mean())
+        self.assertLess(error, abs(ScenarioGenerator(skewt, seed=0)
+                                   .generate(2**12).mean()))
+
+    def test_sobol_partial_blocks(self):
+        """Test Sobol blocks shorter than a power of two."""
+
+        for antithetic in [False, True]:
+            generator = ScenarioGenerator(self.skewt, seed=0, method='sobol',
+                                          antithetic=antithetic,
+                                          blocksize=1024)
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                out = generator.generate(3000, shape=(2, ))
+                small = generator.generate(101, shape=(2, ))
+
+            self.assertTrue(np.all(np.isfinite(out)))
+            np.testing.assert_array_equal(small, out[:101])
+
+    def test_memmap(self):
+        """Test memory-mapped output."""
+
+        generator = ScenarioGenerator(self.skewt, seed=0, blocksize=64)
+        with tempfile.TemporaryDirectory() as path:
+            filename = os.path.join(path, 'scenarios.npy')
+            out = generator.generate(1000, shape=(2, ), dtype=np.float32,
+                                     filename=filename, workers=2)
+            out.flush()
+            del out
+            out = np.load(filename)
+
+        self.assertEqual(out.dtype, np.float32)
+        np.testing.assert_array_equal(
+            out, generator.generate(1000, shape=(2, )).astype(np.float32))
+
+    def test_errors(self):
+        """Test invalid input."""
+
+        self.assertRaises(ValueError, ScenarioGenerator, self.skewt,
+                          method='halton')
+        generator = ScenarioGenerator(self.skewt, seed=0)
+        self.assertRaises(ValueError, generator.generate, 10, (3, ))
+        self.assertRaises(ValueError, generator.fill,
+                          np.empty((10, 4))[:, ::2])
+        generator = ScenarioGenerator(self.skewt, antithetic=True,
+                                      blocksize=3)
+        self.assertRaises(ValueError, generator.generate, 10, (2, ))
+
+
+if __name__ == '__main__':
+    ut.main()
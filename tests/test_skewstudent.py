@@ -5,20 +5,49 @@
 """
 from __future__ import print_function, division
 
+import itertools
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
 import unittest as ut
+from unittest import mock
 import numpy as np
-from scipy.stats import t
+from scipy.integrate import quad
+from scipy.optimize import minimize
+from scipy.stats import t, kstest
 
-from skewstudent import SkewStudent
+import skewstudent
+from skewstudent import SkewStudent, jit
+from skewstudent.skewstudent import (BLOCKSIZE, _cached_constants,
+                                     _dlogpdf_darg)
 
 __author__ = "Stanislav Khrapov"
 __email__ = "khrapovs@gmail.com"
 
+ROOT = os.path.dirname(os.path.abspath(skewstudent.__file__))
+
 
 class SkewStudentTestCase(ut.TestCase):
 
     """Test SkewStudent distribution class."""
 
+    def test_import(self):
+        """Test that plotting and model dependencies are not imported."""
+
+        code = 'import sys, skewstudent; ' \
+            'print(any(name in sys.modules ' \
+            'for name in ["matplotlib", "seaborn", "scipy.signal", ' \
+            '"scipy.stats", "skewstudent.garch"])); ' \
+            'print(skewstudent.SkewStudentGARCH.__module__)'
+        output = subprocess.check_output([sys.executable, '-c', code],
+                                         cwd=os.path.dirname(ROOT))
+
+        self.assertEqual(output.split(), [b'False', b'skewstudent.garch'])
+        self.assertIn('PITBacktest', dir(skewstudent))
+        self.assertRaises(AttributeError, getattr, skewstudent, 'missing')
+
     def test_init(self):
         """Test __init__."""
 
@@ -33,6 +62,102 @@ class SkewStudentTestCase(ut.TestCase):
         self.assertEqual(skewt.eta, eta)
         self.assertEqual(skewt.lam, lam)
 
+        for eta, lam in [(2., 0), (np.nan, 0), (np.array([3., 1.]), 0),
+                         (5., 1.), (5., -1.5), (5., np.array([0, np.nan]))]:
+            self.assertRaises(ValueError, SkewStudent, eta=eta, lam=lam)
+
+        self.assertRaises(ValueError, setattr, skewt, 'eta', 1.)
+        self.assertRaises(ValueError, setattr, skewt, 'lam', 1.)
+        self.assertEqual(skewt.eta, 5.)
+
+    def test_scalar(self):
+        """Test scalar fast path against array evaluation."""
+
+        for eta, lam in [(2.1, -.9), (5., -.3), (30., 0), (500., .5)]:
+            skewt = SkewStudent(eta=eta, lam=lam)
+            for arg in [-1e200, -3., -.5, 0, .19, 2, 1e3]:
+                for method in ['pdf', 'logpdf', 'cdf']:
+                    value = getattr(skewt, method)(arg)
+
+                    self.assertIsInstance(value, float)
+                    self.assertAlmostEqual(
+                        value, getattr(skewt, method)(np.array(arg)), 12)
+
+            for arg in [0, 1e-12, .05, .5, .95, 1]:
+                value = skewt.ppf(arg)
+
+                self.assertIsInstance(value, float)
+                np.testing.assert_allclose(value, skewt.ppf(np.array([arg])))
+
+        skewt = SkewStudent(eta=np.array([3., 5.]))
+
+        self.assertEqual(skewt.pdf(0.).shape, (2, ))
+        self.assertEqual(skewt.ppf(.5).shape, (2, ))
+
+    def test_backend(self):
+        """Test selection of computational backend."""
+
+        self.assertEqual(SkewStudent().backend, 'numpy')
+        self.assertRaises(ValueError, SkewStudent, backend='fortran')
+
+        with mock.patch.dict(os.environ, {'SKEWSTUDENT_BACKEND': 'numba'}):
+            with mock.patch.object(jit, 'AVAILABLE', False):
+                self.assertEqual(SkewStudent().backend, 'numpy')
+            self.assertEqual(SkewStudent().backend,
+                             'numba' if jit.AVAILABLE else 'numpy')
+
+    @ut.skipUnless(jit.AVAILABLE, 'numba is not installed')
+    def test_numba(self):
+        """Compare compiled kernels with NumPy."""
+
+        param = [4., .3]
+        skewt = SkewStudent(*param)
+        skewt_jit = SkewStudent(*param, backend='numba')
+        arg = np.linspace(-5, 5, 101).reshape((101, 1))
+
+        np.testing.assert_allclose(skewt_jit.pdf(arg), skewt.pdf(arg))
+        np.testing.assert_allclose(skewt_jit.logpdf(arg), skewt.logpdf(arg))
+        np.testing.assert_allclose(
+            skewt_jit.pdf(arg, dtype=np.float32), skewt.pdf(arg), rtol=1e-5)
+        self.assertAlmostEqual(skewt_jit.loglikelihood(param, arg),
+                               skewt.loglikelihood(param, arg))
+        self.assertIsInstance(skewt_jit.pdf(0), float)
+
+        out = np.empty((101, 2))[:, :1]
+        self.assertIs(skewt_jit.pdf(arg, out=out), out)
+        np.testing.assert_allclose(out, skewt.pdf(arg))
+
+        for method in ('pdf', 'logpdf'):
+            self.assertRaises(ValueError, getattr(skewt_jit, method),
+                              np.zeros(20), out=np.empty(10))
+        out = np.empty((101, 3))
+        self.assertIs(skewt_jit.pdf(arg, out=out), out)
+        np.testing.assert_allclose(out, np.broadcast_to(skewt.pdf(arg),
+                                                        (101, 3)))
+
+    def test_constants_cache(self):
+        """Test caching of a, b, and c constants."""
+
+        arg = np.linspace(-1, 1, 10)
+        skewt = SkewStudent(eta=5., lam=-.2)
+        pdf = skewt.pdf(arg)
+
+        skewt.eta = 4.
+        self.assertFalse(np.allclose(skewt.pdf(arg), pdf))
+        np.testing.assert_array_equal(skewt.pdf(arg),
+                                      SkewStudent(eta=4., lam=-.2).pdf(arg))
+
+        skewt.lam = .3
+        np.testing.assert_array_equal(skewt.pdf(arg),
+                                      SkewStudent(eta=4., lam=.3).pdf(arg))
+
+        _cached_constants.cache_clear()
+        SkewStudent(eta=5., lam=-.2).pdf(arg)
+        SkewStudent(eta=5., lam=-.2).cdf(arg)
+        info = _cached_constants.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
     def test_pdf(self):
         """Test pdf method."""
 
@@ -45,6 +170,72 @@ class SkewStudentTestCase(ut.TestCase):
         self.assertEqual(pdf.shape[0], num)
         self.assertIsInstance(skewt.pdf(0), float)
 
+    def test_out_dtype(self):
+        """Test out and dtype arguments of pdf, logpdf and cdf."""
+
+        skewt = SkewStudent(eta=4., lam=.3)
+        arg = np.linspace(-3, 3, 3 * BLOCKSIZE + 7)
+
+        for method in [skewt.pdf, skewt.logpdf, skewt.cdf]:
+            values = method(arg)
+
+            out = np.empty_like(arg)
+            self.assertIs(method(arg, out=out), out)
+            np.testing.assert_array_equal(out, values)
+
+            values32 = method(arg.astype(np.float32), dtype=np.float32)
+            self.assertEqual(values32.dtype, np.float32)
+            np.testing.assert_allclose(values32, values, rtol=1e-5,
+                                       atol=1e-6)
+
+            out = np.empty(arg.shape, dtype=np.float32)
+            self.assertIs(method(arg, out=out), out)
+            np.testing.assert_array_equal(out, values32)
+
+    def test_logpdf(self):
+        """Test logpdf method."""
+
+        skewt = SkewStudent(eta=3., lam=-.5)
+
+        arg = np.linspace(-2, 2, 50)
+        np.testing.assert_array_almost_equal(skewt.logpdf(arg),
+                                             np.log(skewt.pdf(arg)))
+        self.assertAlmostEqual(skewt.loglikelihood([3., -.5], arg),
+                               -np.log(skewt.pdf(arg)).sum())
+
+        skewt = SkewStudent(eta=2.1, lam=.5)
+        logpdf = skewt.logpdf(np.array([-1e120, 1e120]))
+
+        self.assertTrue(np.all(np.isfinite(logpdf)))
+        self.assertTrue(np.isfinite(skewt.loglikelihood([2.1, .5],
+                                                        [-1e120, 1e120])))
+
+        # squared argument overflows beyond 1e154
+        arg_tail = np.array([-1.7e308, -1e200, -1e150, 1e150, 1e200, 1.7e308])
+        with np.errstate(over='raise', divide='raise', invalid='raise'):
+            logpdf = skewt.logpdf(arg_tail)
+            for backend in ('numpy', 'numba') if jit.AVAILABLE else ('numpy',):
+                skewt_tail = SkewStudent(2.1, .5, backend=backend)
+                np.testing.assert_allclose(skewt_tail.logpdf(arg_tail),
+                                           logpdf)
+                self.assertAlmostEqual(
+                    skewt_tail.loglikelihood([2.1, .5], arg_tail),
+                    -logpdf.sum())
+            np.testing.assert_allclose(
+                [skewt.logpdf(float(value)) for value in arg_tail], logpdf)
+        self.assertTrue(np.all(np.isfinite(logpdf)))
+        # log-density decays as a power of the argument
+        np.testing.assert_allclose(np.diff(logpdf[3:]) / np.diff(
+            np.log(arg_tail[3:])), -3.1)
+        np.testing.assert_allclose(np.diff(logpdf[:3]) / np.diff(
+            np.log(-arg_tail[:3])), -3.1)
+
+        skewt = SkewStudent(eta=1e3, lam=0)
+        standt = t(1e3, scale=(1 - 2e-3)**.5)
+
+        np.testing.assert_array_almost_equal(skewt.logpdf(arg),
+                                             standt.logpdf(arg))
+
     def test_cdf(self):
         """Test cdf method."""
 
@@ -57,6 +248,51 @@ class SkewStudentTestCase(ut.TestCase):
         self.assertEqual(cdf.shape[0], num)
         self.assertIsInstance(skewt.cdf(0), float)
 
+        out = np.empty(num)
+        self.assertIs(skewt.cdf(arg, out=out), out)
+        np.testing.assert_array_equal(out, cdf)
+
+    def test_logcdf(self):
+        """Test logcdf and logsf methods."""
+
+        arg = np.linspace(-30, 30, 1001)
+        for eta, lam in [(2.1, -.9), (5., -.3), (30., 0), (500., .5)]:
+            skewt = SkewStudent(eta=eta, lam=lam)
+            cdf = skewt.cdf(arg)
+            inside = (cdf > 1e-300) & (cdf < 1 - 1e-12)
+
+            np.testing.assert_allclose(skewt.logcdf(arg)[inside],
+                                       np.log(cdf[inside]),
+                                       rtol=1e-10, atol=1e-15)
+            np.testing.assert_allclose(skewt.logsf(arg)[inside],
+                                       np.log1p(-cdf[inside]),
+                                       rtol=1e-4, atol=1e-15)
+            if lam == 0:
+                np.testing.assert_allclose(skewt.logsf(arg),
+                                           skewt.logcdf(-arg))
+
+            tails = np.array([-1e300, -1e100, 1e100, 1e300])
+            logcdf = skewt.logcdf(tails)
+            logsf = skewt.logsf(tails)
+
+            self.assertTrue(np.all(np.isfinite(logcdf[:2])))
+            self.assertTrue(np.all(np.isfinite(logsf[2:])))
+            self.assertTrue(np.all(np.diff(logcdf) >= 0))
+            self.assertTrue(np.all(np.diff(logsf) <= 0))
+            self.assertLess(logcdf[0], logcdf[1])
+            self.assertLess(logsf[3], logsf[2])
+            # Student t tail decays as a power of the argument
+            np.testing.assert_allclose(
+                np.diff(logcdf[:2]) / np.diff(np.log(-tails[:2])), -eta)
+
+        skewt = SkewStudent(eta=np.array([3., 10.]), lam=np.array([-.5, .5]))
+        logcdf = skewt.logcdf(arg[:, np.newaxis])
+
+        self.assertEqual(logcdf.shape, (1001, 2))
+        for col in range(2):
+            scalar = SkewStudent(eta=skewt.eta[col], lam=skewt.lam[col])
+            np.testing.assert_allclose(logcdf[:, col], scalar.logcdf(arg))
+
     def test_ppf(self):
         """Test ppf method."""
 
@@ -69,6 +305,103 @@ class SkewStudentTestCase(ut.TestCase):
         self.assertEqual(ppf.shape[0], num)
         self.assertIsInstance(skewt.ppf(.5), float)
 
+        out = np.empty(num)
+        self.assertIs(skewt.ppf(arg, out=out), out)
+        np.testing.assert_array_equal(out, ppf)
+        out = np.empty(1)
+        self.assertIs(skewt.ppf(np.array([.3]), out=out), out)
+        self.assertEqual(out[0], skewt.ppf(.3))
+        self.assertIsInstance(skewt.ppf(np.array([.3])), float)
+        np.testing.assert_array_almost_equal(skewt.cdf(ppf), arg)
+
+        with np.errstate(all='raise'):
+            ppf = skewt.ppf([0, 1])
+        np.testing.assert_array_equal(ppf, [-np.inf, np.inf])
+
+        for eta in [2.1, 5., 30.]:
+            skewt = SkewStudent(eta=eta, lam=-.5)
+            arg = np.array([1e-300, 1e-200, 1e-100])
+            ppf = skewt.ppf(arg)
+
+            self.assertTrue(np.all(np.isfinite(ppf)))
+            np.testing.assert_allclose(skewt.logcdf(ppf), np.log(arg))
+            self.assertEqual(skewt.ppf(1e-200), ppf[1])
+
+    def test_ppf_approx(self):
+        """Test tabulated ppf."""
+
+        arg = np.concatenate([np.linspace(1e-6, 1 - 1e-6, 10001),
+                              [1e-9, 1 - 1e-9]])
+
+        for eta, lam in [(2.05, -.9), (3., .5), (30., 0), (500., .1)]:
+            skewt = SkewStudent(eta=eta, lam=lam)
+            ppf = skewt.ppf(arg, approx=True)
+            error = np.abs(ppf - skewt.ppf(arg)).max()
+
+            self.assertLess(error, 1e-10)
+
+        tol = 1e-6
+        skewt = SkewStudent(lam=np.array([-.5, .5]))
+        ppf = skewt.ppf(arg[:, np.newaxis], approx=True, tol=tol)
+        error = np.abs(ppf - skewt.ppf(arg[:, np.newaxis])).max()
+
+        self.assertLess(error, tol)
+
+        skewt = SkewStudent(eta=np.array([3., 4.]))
+        self.assertRaises(ValueError, skewt.ppf, arg, approx=True)
+
+    def test_moments(self):
+        """Test closed-form moments and risk measures."""
+
+        skewt = SkewStudent(eta=6., lam=-.4)
+
+        def integral(func, upper=np.inf):
+            return quad(lambda arg: func(arg) * skewt.pdf(arg),
+                        -np.inf, upper)[0]
+
+        self.assertAlmostEqual(skewt.moment(1), 0)
+        self.assertAlmostEqual(skewt.moment(2), 1)
+        self.assertAlmostEqual(skewt.skewness(),
+                               integral(lambda arg: arg**3))
+        self.assertAlmostEqual(skewt.kurtosis(),
+                               integral(lambda arg: arg**4) - 3, 6)
+        self.assertAlmostEqual(skewt.moment(5),
+                               integral(lambda arg: arg**5), 5)
+
+        for alpha in [.01, .05, .5, .9]:
+            quantile = skewt.ppf(alpha)
+            shortfall = integral(lambda arg: arg, quantile) / alpha
+
+            self.assertEqual(skewt.value_at_risk(alpha), quantile)
+            self.assertAlmostEqual(skewt.expected_shortfall(alpha),
+                                   shortfall)
+            self.assertLess(skewt.expected_shortfall(alpha), quantile)
+
+        skewt = SkewStudent(eta=np.array([3., 5., 10.]),
+                            lam=np.array([.3, -.2, 0.]))
+        alpha = np.array([[.01], [.05]])
+        shortfall = skewt.expected_shortfall(alpha)
+
+        self.assertEqual(shortfall.shape, (2, 3))
+        for i, j in itertools.product(range(2), range(3)):
+            scalar = SkewStudent(eta=skewt.eta[j], lam=skewt.lam[j])
+            self.assertAlmostEqual(shortfall[i, j],
+                                   scalar.expected_shortfall(alpha[i, 0]))
+
+        kurtosis = skewt.kurtosis()
+        self.assertTrue(np.isinf(kurtosis[0]))
+        self.assertTrue(np.isnan(skewt.skewness()[0]))
+        self.assertAlmostEqual(kurtosis[2], t.stats(10., moments='k'))
+
+        # divergent moments at integer degrees of freedom
+        with np.errstate(all='raise'):
+            for eta, lam in [(3., 0.), (4., .3), (2.5, -.2)]:
+                skewt = SkewStudent(eta=eta, lam=lam)
+                self.assertTrue(np.isnan(skewt.moment(5)))
+                self.assertTrue(np.isinf(skewt.moment(4)))
+                self.assertTrue(np.isinf(skewt.kurtosis()))
+            self.assertTrue(np.isnan(SkewStudent(3., 0.).skewness()))
+
     def test_rvs(self):
         """Test ppf method."""
 
@@ -90,6 +423,260 @@ class SkewStudentTestCase(ut.TestCase):
         self.assertIsInstance(rvs, np.ndarray)
         self.assertEqual(rvs.shape, size)
 
+        np.testing.assert_array_equal(skewt.rvs(size=10, random_state=42),
+                                      skewt.rvs(size=10, random_state=42))
+        rng = np.random.default_rng(42)
+        np.testing.assert_array_equal(skewt.rvs(size=10, random_state=42),
+                                      skewt.rvs(size=10, random_state=rng))
+
+        for eta, lam in [(3., -.5), (10., .7)]:
+            skewt = SkewStudent(eta=eta, lam=lam)
+            rvs = skewt.rvs(size=20000, random_state=0)
+            pvalue = kstest(rvs, skewt.cdf).pvalue
+
+            self.assertGreater(pvalue, 1e-3)
+
+    def test_array_param(self):
+        """Test broadcasting of array-valued parameters."""
+
+        eta = np.array([3., 5., 10., 30.])
+        lam = np.array([-.5, -.1, .2, .7])
+        skewt = SkewStudent(eta=eta, lam=lam)
+        arg = np.array([-1.5, .1, .3, 2.])
+        prob = np.array([.01, .3, .6, .95])
+
+        pdf = [SkewStudent(eta=e, lam=l).pdf(x)
+               for e, l, x in zip(eta, lam, arg)]
+        cdf = [SkewStudent(eta=e, lam=l).cdf(x)
+               for e, l, x in zip(eta, lam, arg)]
+        ppf = [SkewStudent(eta=e, lam=l).ppf(p)
+               for e, l, p in zip(eta, lam, prob)]
+
+        np.testing.assert_array_almost_equal(skewt.pdf(arg), pdf)
+        np.testing.assert_array_almost_equal(skewt.cdf(arg), cdf)
+        np.testing.assert_array_almost_equal(skewt.ppf(prob), ppf)
+
+        grid = np.linspace(-2, 2, 7)[:, np.newaxis]
+        self.assertEqual(skewt.pdf(grid).shape, (7, 4))
+        self.assertEqual(skewt.cdf(grid).shape, (7, 4))
+
+        self.assertEqual(skewt.rvs().shape, (4, ))
+        self.assertEqual(skewt.rvs(size=(10, 4)).shape, (10, 4))
+
+        llf = skewt.loglikelihood([eta, lam], arg)
+        self.assertAlmostEqual(llf, -np.log(pdf).sum())
+
+    def test_loglikelihood_blocks(self):
+        """Test log-likelihood reduced over blocks."""
+
+        skewt = SkewStudent(eta=4., lam=.3)
+        param = [5., -.2]
+        arg = skewt.rvs(size=10 * BLOCKSIZE + 3, random_state=0)
+        llf = -np.log(SkewStudent(*param).pdf(arg)).sum()
+
+        for workers in [None, 1, 4]:
+            tracemalloc.start()
+            value = skewt.loglikelihood(param, arg, workers=workers)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            self.assertAlmostEqual(value / llf, 1)
+            # a few blocks per thread, well below a copy of the input
+            self.assertLess(peak, arg.nbytes * .75)
+
+    def test_loglikelihood_grid(self):
+        """Test log-likelihood on a grid of parameters."""
+
+        skewt = SkewStudent(eta=5., lam=-.3)
+        data = skewt.rvs(size=1000, random_state=0)
+        eta = np.array([2.5, 5., 30.])
+        lam = np.array([-.9, -.3, 0, .5])
+
+        for workers in [None, 2]:
+            grid = skewt.loglikelihood_grid(eta, lam, data, workers=workers)
+
+            self.assertEqual(grid.shape, (3, 4))
+            for i, j in itertools.product(range(3), range(4)):
+                self.assertAlmostEqual(
+                    grid[i, j], skewt.loglikelihood([eta[i], lam[j]], data),
+                    places=8)
+
+        self.assertEqual(skewt.eta, 5.)
+        self.assertEqual(np.unravel_index(grid.argmin(), grid.shape), (1, 1))
+
+        eta, lam = np.linspace(2, 30, 5), np.linspace(-1, 1, 5)
+        with np.errstate(all='raise'):
+            grid = skewt.loglikelihood_grid(eta, lam, data)
+        for i, j in itertools.product(range(5), range(5)):
+            self.assertAlmostEqual(
+                grid[i, j], skewt.loglikelihood([eta[i], lam[j]], data),
+                places=8)
+        self.assertTrue(np.all(grid[0] == np.inf))
+        self.assertTrue(np.all(grid[:, [0, -1]] == np.inf))
+        self.assertTrue(np.all(np.isfinite(grid[1:, 1:-1])))
+        self.assertEqual(np.unravel_index(grid.argmin(), grid.shape)[1], 1)
+
+    def test_stream(self):
+        """Test streaming evaluation over chunks of data."""
+
+        skewt = SkewStudent(eta=4., lam=.3)
+        data = skewt.rvs(size=1000, random_state=0)
+        param = [5., -.2]
+        llf = skewt.loglikelihood(param, data)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'data.npy')
+            np.save(path, data)
+            memmap = np.load(path, mmap_mode='r')
+            sources = [data, path, memmap, np.array_split(data, 7)]
+
+            for source, prefetch in itertools.product(sources,
+                                                      [True, False]):
+                chunks = list(skewt.stream_pdf(source, chunksize=64,
+                                               prefetch=prefetch))
+                np.testing.assert_array_equal(np.concatenate(chunks),
+                                              skewt.pdf(data))
+                np.testing.assert_array_equal(
+                    np.concatenate(list(skewt.stream_logpdf(source))),
+                    skewt.logpdf(data))
+                np.testing.assert_array_equal(
+                    np.concatenate(list(skewt.stream_cdf(source))),
+                    skewt.cdf(data))
+                self.assertAlmostEqual(
+                    skewt.stream_loglikelihood(param, source, chunksize=64,
+                                               prefetch=prefetch), llf)
+
+            del memmap
+
+        chunks = list(skewt.stream_pdf(data.reshape((100, 10)),
+                                       chunksize=25))
+        self.assertEqual(len(chunks), 50)
+        self.assertEqual(chunks[0].shape, (2, 10))
+
+    def test_loglikelihood_derivatives(self):
+        """Test analytic gradient and Hessian of log-likelihood."""
+
+        skewt = SkewStudent(eta=5., lam=-.3)
+        arg = skewt.rvs(size=200)
+
+        def numgrad(fun, param, step=1e-6):
+            grad = []
+            for shift in np.eye(len(param)) * step:
+                grad.append((fun(param + shift, arg)
+                             - fun(param - shift, arg)) / (2 * step))
+            return np.array(grad).T
+
+        for param in [np.array([5., -.3]), np.array([3.5, .6])]:
+            llf, grad = skewt.loglikelihood_and_grad(param, arg)
+            hess = skewt.loglikelihood_hess(param, arg)
+
+            self.assertAlmostEqual(llf, skewt.loglikelihood(param, arg))
+            np.testing.assert_allclose(
+                grad, numgrad(skewt.loglikelihood, param), rtol=1e-5)
+            np.testing.assert_allclose(
+                skewt.loglikelihood_grad(param, arg), grad)
+            np.testing.assert_allclose(
+                hess, numgrad(skewt.loglikelihood_grad, param), rtol=1e-5)
+            np.testing.assert_array_equal(hess, hess.T)
+
+        param = (np.array(5.), np.array(-.3))
+        llf, grad = skewt.loglikelihood_and_grad(param, arg)
+        self.assertAlmostEqual(llf, skewt.loglikelihood(param, arg))
+        np.testing.assert_allclose(grad, skewt.loglikelihood_grad([5., -.3],
+                                                                  arg))
+        np.testing.assert_allclose(skewt.loglikelihood_hess(param, arg),
+                                   skewt.loglikelihood_hess([5., -.3], arg))
+        np.testing.assert_array_equal(_dlogpdf_darg(arg, *param),
+                                      _dlogpdf_darg(arg, 5., -.3))
+
+    def test_fit(self):
+        """Test fit method."""
+
+        eta, lam = 5., -.3
+        skewt = SkewStudent(eta=eta, lam=lam)
+        np.random.seed(0)
+        data = skewt.rvs(size=(2000, 3))
+
+        res = SkewStudent.fit(data[:, 0])
+
+        self.assertTrue(res.success)
+        self.assertEqual(res.x.shape, (2, ))
+        self.assertEqual(res.cov.shape, (2, 2))
+        np.testing.assert_allclose(res.x, [eta, lam], rtol=.3)
+        self.assertTrue(np.all(np.diag(res.cov) > 0))
+        self.assertAlmostEqual(skewt.loglikelihood(res.x, data[:, 0]), res.fun)
+        self.assertEqual((skewt.eta, skewt.lam), (eta, lam))
+
+        res_all = SkewStudent.fit(data)
+
+        self.assertEqual(res_all.x.shape, (3, 2))
+        self.assertEqual(res_all.cov.shape, (3, 2, 2))
+        self.assertTrue(np.all(res_all.success))
+        np.testing.assert_allclose(res_all.x[0], res.x)
+
+        res_warm = SkewStudent.fit(data, param_start=res_all.x)
+
+        np.testing.assert_allclose(res_warm.x, res_all.x, rtol=1e-3)
+        self.assertTrue(np.all(res_warm.nit <= res_all.nit))
+
+        for workers, chunksize in [(2, None), (3, 1)]:
+            res_par = SkewStudent.fit(data, workers=workers,
+                                      chunksize=chunksize)
+
+            np.testing.assert_array_equal(res_par.x, res_all.x)
+            np.testing.assert_array_equal(res_par.cov, res_all.cov)
+
+    def test_loglikelihood_support(self):
+        """Test log-likelihood outside of the support of parameters."""
+
+        skewt = SkewStudent(eta=5., lam=-.3)
+        arg = skewt.rvs(size=500, random_state=np.random.default_rng(0))
+
+        for param in [(1.5, 0.), (10., 1.), (10., -1.2), (2., 0.)]:
+            self.assertEqual(skewt.loglikelihood(param, arg), np.inf)
+            self.assertEqual(skewt.stream_loglikelihood(param, arg), np.inf)
+            llf, grad = skewt.loglikelihood_and_grad(param, arg)
+            self.assertEqual(llf, np.inf)
+            self.assertTrue(np.all(np.isnan(grad)))
+            self.assertTrue(np.all(np.isnan(
+                skewt.loglikelihood_hess(param, arg))))
+        self.assertEqual(skewt.loglikelihood(
+            (np.array([5., 1.5]), 0.), arg[:2]), np.inf)
+
+        res = minimize(skewt.loglikelihood, [10, 0], args=(arg,),
+                       method='SLSQP', bounds=[(2.01, 300), (-1, 1)])
+        self.assertTrue(res.success)
+        np.testing.assert_allclose(res.x, [5., -.3], rtol=.5, atol=.1)
+
+        res = minimize(skewt.loglikelihood, [10, 0], args=(arg,),
+                       method='Powell')
+        self.assertTrue(np.isfinite(res.fun))
+
+    def test_fit_rolling(self):
+        """Test fit on rolling and expanding windows."""
+
+        data = SkewStudent(eta=5., lam=-.3).rvs(size=(1200, 2),
+                                                 random_state=0)
+        res = SkewStudent.fit_rolling(data[:, 0], 500, step=100)
+
+        np.testing.assert_array_equal(res.end, np.arange(500, 1201, 100))
+        self.assertEqual(res.x.shape, (8, 2))
+        self.assertEqual(res.cov.shape, (8, 2, 2))
+        self.assertTrue(res.success.all())
+        for end, param in zip(res.end, res.x):
+            cold = SkewStudent.fit(data[end-500:end, 0])
+            np.testing.assert_allclose(param, cold.x, rtol=1e-3, atol=1e-3)
+
+        res = SkewStudent.fit_rolling(data, 500, step=350, expanding=True)
+
+        self.assertEqual(res.x.shape, (2, 3, 2))
+        for col in range(2):
+            np.testing.assert_allclose(
+                res.x[col, -1], SkewStudent.fit(data[:, col]).x,
+                rtol=1e-3, atol=1e-3)
+
+        self.assertRaises(ValueError, SkewStudent.fit_rolling, data, 2000)
+
     def test_compare_with_t(self):
         """Compare with standard t distribution."""
 
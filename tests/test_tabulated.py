@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Testing suite for QuantileTable class.
+
+"""
+from __future__ import print_function, division
+
+import unittest as ut
+import numpy as np
+from scipy.stats import t
+
+from skewstudent.tabulated import QuantileTable, quantile_table
+
+__author__ = "Stanislav Khrapov"
+__email__ = "khrapovs@gmail.com"
+
+
+class QuantileTableTestCase(ut.TestCase):
+
+    """Test QuantileTable class."""
+
+    def test_ppf(self):
+        """Test ppf method."""
+
+        arg = np.linspace(1e-8, 1 - 1e-8, 10001)
+
+        for eta in [2.01, 5., 1e3]:
+            table = QuantileTable(eta)
+            error = np.abs(table.ppf(arg) - t.ppf(arg, eta)).max()
+
+            self.assertLess(table.max_error, 1e-10)
+            self.assertLess(error, 1e-10)
+
+        table = QuantileTable(5.)
+        arg = np.array([0, 1e-12, .5, 1 - 1e-12, 1, np.nan])
+        ppf = table.ppf(arg)
+
+        np.testing.assert_array_equal(ppf[[0, 2, 4]], [-np.inf, 0, np.inf])
+        np.testing.assert_allclose(ppf[[1, 3]], t.ppf(arg[[1, 3]], 5.))
+        self.assertTrue(np.isnan(ppf[-1]))
+
+    def test_tolerance(self):
+        """Test grid refinement."""
+
+        coarse = QuantileTable(5., tol=1e-4)
+        fine = QuantileTable(5., tol=1e-12)
+
+        self.assertLess(coarse.max_error, 1e-4)
+        self.assertLess(fine.max_error, 1e-12)
+        self.assertLess(coarse.coef.shape[1], fine.coef.shape[1])
+        self.assertIs(quantile_table(5.), quantile_table(5.))
+
+        self.assertRaises(ValueError, QuantileTable, 2.01, tol=1e-15)
+        self.assertRaises(ValueError, QuantileTable, 5., tol=1e-12,
+                          max_nsteps=64)
+
+
+if __name__ == '__main__':
+    ut.main()